@@ -13,7 +13,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from osins_seedance import (
     VideoGenerationRequestBody,
-    seed_generations_tasks
+    seed_generations_tasks,
+    setup_logging
 )
 
 
@@ -231,6 +232,7 @@ def example_return_last_frame():
 
 def main():
     """Run all examples"""
+    setup_logging()
     print("Seedance Video Generation API Examples")
     print("=" * 50)
     print()
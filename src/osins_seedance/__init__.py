@@ -1,17 +1,30 @@
 """Osins-Seedance API Package"""
 
-# Import v3 modules to make them accessible at package level
-from .v3 import (
-    seed_generations_tasks, 
-    get_seedance_models,
-    VideoGenerationRequestBody,
-    VideoGenerationResponseBody
-)
-
 __version__ = "3.0.0"
 __all__ = [
-    "seed_generations_tasks", 
+    "seed_generations_tasks",
     "get_seedance_models",
     "VideoGenerationRequestBody",
-    "VideoGenerationResponseBody"
-]
\ No newline at end of file
+    "VideoGenerationResponseBody",
+    "setup_logging"
+]
+
+
+def __getattr__(name: str):
+    """
+    Lazily import v3 members on first access (PEP 562).
+
+    Importing the package no longer pulls in requests, dotenv and pydantic
+    until one of the exported names is actually used.
+    """
+    if name in __all__:
+        from . import v3
+        value = getattr(v3, name)
+        # Cache on the module so later lookups bypass __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
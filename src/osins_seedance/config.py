@@ -1,13 +1,18 @@
 """Configuration utilities for the Seedance API client."""
 
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_api_base_host() -> str:
     """
     Get the API base host address
 
+    The value is read once and cached; call get_api_base_host.cache_clear()
+    after changing VOLCES_BASE_HOST at runtime.
+
     Returns:
         API base host address, without version path
     """
-    return os.getenv("VOLCES_BASE_HOST") or "https://api.volces.com"
\ No newline at end of file
+    return os.getenv("VOLCES_BASE_HOST") or "https://api.volces.com"
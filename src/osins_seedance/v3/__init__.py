@@ -6,6 +6,7 @@ from .model.response_body import SeedanceResponseBody
 from .model.video_generation_request_body import VideoGenerationRequestBody
 from .model.video_generation_response_body import VideoGenerationResponseBody
 from .client.volces_client import VolcesClient
+from .utils.common_utils import setup_logging
 
 __all__ = [
     "seed_generations_tasks",
@@ -14,5 +15,6 @@ __all__ = [
     "SeedanceResponseBody",
     "VideoGenerationRequestBody",
     "VideoGenerationResponseBody",
-    "VolcesClient"
+    "VolcesClient",
+    "setup_logging"
 ]
\ No newline at end of file
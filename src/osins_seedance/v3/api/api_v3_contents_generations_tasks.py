@@ -2,21 +2,79 @@
 
 import os
 import time
-from typing import Optional
+import atexit
+import threading
+from typing import Optional, Tuple
 from ..model.video_generation_request_body import VideoGenerationRequestBody
 from ..model.video_generation_response_body import VideoGenerationResponseBody
+from ..model.response_body import SeedanceResponseBody
 from ..client.volces_client import VolcesClient
-from ..utils.common_utils import load_environment_variables, setup_logging
+from ..utils.common_utils import load_environment_variables
 import logging
 
 
-# Load environment variables from .env file
-load_environment_variables()
-
-# Setup logging
-setup_logging()
+# Logging is configured by the application (e.g. via setup_logging()), not on import
 logger = logging.getLogger(__name__)
 
+# Shared client so the session's connection pool and retry adapter are reused
+# across calls. VolcesClient is safe to share between threads because its
+# requests.Session hands out pooled connections per request.
+_client: Optional[VolcesClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> VolcesClient:
+    """
+    Get the shared Volces API client, creating it on first use.
+
+    Returns:
+        Shared VolcesClient instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Open the first connection while the caller builds its request
+                _client = VolcesClient(warm_up=True)
+    return _client
+
+
+# Model lists change on the order of days, so successful responses are reused
+# for VOLCES_MODELS_TTL seconds: (monotonic timestamp, response)
+_MODELS_TTL: Optional[float] = None
+_models_cache: Optional[Tuple[float, SeedanceResponseBody]] = None
+
+
+def _models_ttl() -> float:
+    """
+    Get the model list cache TTL, reading VOLCES_MODELS_TTL on first use.
+
+    Returns:
+        TTL in seconds
+    """
+    global _MODELS_TTL
+    if _MODELS_TTL is None:
+        # The .env file is loaded on first use rather than at import
+        load_environment_variables()
+        _MODELS_TTL = float(os.getenv("VOLCES_MODELS_TTL", "300"))
+    return _MODELS_TTL
+
+
+def clear_models_cache():
+    """Drop the cached model list so the next call fetches it from the API."""
+    global _models_cache
+    _models_cache = None
+
+
+@atexit.register
+def _close_client():
+    """Close the shared client session at interpreter shutdown."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
 
 def seed_generations_tasks(request_body: VideoGenerationRequestBody) -> VideoGenerationResponseBody:
     """
@@ -29,27 +87,25 @@ def seed_generations_tasks(request_body: VideoGenerationRequestBody) -> VideoGen
     Returns:
         Response body from the API with task ID
     """
-    # Create a client instance
-    client = VolcesClient()
+    # Reuse the shared client instance
+    client = _get_client()
 
-    try:
-        # Log the API call
+    # Log the API call; the text snippet is only built when INFO records are emitted
+    if logger.isEnabledFor(logging.INFO):
         text_content = next((item.text for item in request_body.content if item.type == "text"), "No text content")
-        logger.info(f"Making video generations tasks API call with model: {request_body.model}, text: {text_content[:50]}{'...' if len(text_content) > 50 else ''}")
-
-        start_time = time.time()
+        snippet = text_content if len(text_content) <= 50 else text_content[:50] + "..."
+        logger.info("Making video generations tasks API call with model: %s, text: %s",
+                    request_body.model, snippet)
 
-        # Call the API using the client's video generation method
-        response = client.call_video_generation_api(request_body)
+    start_time = time.perf_counter()
 
-        duration = time.time() - start_time
-        logger.info(f"Video generations tasks API call completed in {duration:.2f}s")
+    # Call the API using the client's video generation method
+    response = client.call_video_generation_api(request_body)
 
-        return response
+    duration = time.perf_counter() - start_time
+    logger.info("Video generations tasks API call completed in %.2fs", duration)
 
-    finally:
-        # Clean up resources
-        client.close()
+    return response
 
 
 def get_seedance_models() -> VideoGenerationResponseBody:
@@ -60,20 +116,27 @@ def get_seedance_models() -> VideoGenerationResponseBody:
     Returns:
         Response body containing available models
     """
-    # Create a client instance
-    client = VolcesClient()
+    global _models_cache
+
+    # Serve the model list from cache while it is fresh
+    cached = _models_cache
+    if cached is not None and time.monotonic() - cached[0] < _models_ttl():
+        logger.info("Returning cached models list")
+        return cached[1]
+
+    # Reuse the shared client instance
+    client = _get_client()
 
-    try:
-        start_time = time.time()
+    start_time = time.perf_counter()
 
-        # Get models using the client
-        response = client.get_volces_models()
+    # Get models using the client
+    response = client.get_volces_models()
 
-        duration = time.time() - start_time
-        logger.info(f"Models fetch completed in {duration:.2f}s")
+    duration = time.perf_counter() - start_time
+    logger.info("Models fetch completed in %.2fs", duration)
 
-        return response
+    # Only successful responses are cached; concurrent refreshes are harmless since the GET is idempotent
+    if response.error is None:
+        _models_cache = (time.monotonic(), response)
 
-    finally:
-        # Clean up resources
-        client.close()
\ No newline at end of file
+    return response
\ No newline at end of file
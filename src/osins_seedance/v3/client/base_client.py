@@ -4,15 +4,22 @@ import os
 import time
 import requests
 from typing import Optional
+from pydantic_core import to_json
 from ..utils.common_utils import get_api_key
 from ..model.request_body import SeedanceRequestBody
 from ..model.response_body import SeedanceResponseBody
 from ..config.config import get_v3_api_base_url
+from .connection_pool import ConnectionPoolManager
 
 
 class BaseClient:
     """Basic API client with core functionality"""
 
+    __slots__ = ("api_key", "base_url", "timeout", "session")
+
+    # Supported HTTP methods, mapped to whether they send a JSON body
+    _METHOD_SENDS_BODY = {"GET": False, "POST": True, "PUT": True, "DELETE": False}
+
     def __init__(self, api_key: str = None, base_url: str = None, timeout: int = 30):
         """
         Initialize the base API client.
@@ -31,6 +38,11 @@ class BaseClient:
             self.base_url = get_v3_api_base_url()
         self.timeout = timeout
 
+        # Persistent keep-alive session so repeated calls reuse pooled connections;
+        # the auth headers are constant for the client's lifetime and set once here
+        self.session = ConnectionPoolManager(pool_connections=10, pool_maxsize=20, max_retries=0).create_session()
+        self.session.headers.update(self._get_auth_headers())
+
     def _get_auth_headers(self) -> dict:
         """Helper method to get authentication headers."""
         return {
@@ -50,19 +62,26 @@ class BaseClient:
         Returns:
             Response from the API
         """
-        headers = self._get_auth_headers()
-        
-        url = f"{self.base_url}{endpoint}"
-        
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers, timeout=self.timeout)
-        elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=self.timeout)
-        elif method.upper() == "PUT":
-            response = requests.put(url, headers=headers, json=data, timeout=self.timeout)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=self.timeout)
-        else:
+        http_method = method.upper()
+        sends_body = self._METHOD_SENDS_BODY.get(http_method)
+        if sends_body is None:
             raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        return response
\ No newline at end of file
+
+        url = f"{self.base_url}{endpoint}"
+
+        if sends_body:
+            # pydantic-core encodes straight to bytes instead of going through the json module;
+            # Content-Type is already set on the session
+            body = to_json(data) if data is not None else None
+            return self.session.request(http_method, url, data=body, timeout=self.timeout)
+        return self.session.request(http_method, url, timeout=self.timeout)
+
+    def close(self):
+        """Close the client session and clean up resources."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,16 +1,19 @@
 """Cache mechanism implementation for API responses"""
 
-import hashlib
+import heapq
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Any, List, Tuple
 from ..model.response_body import SeedanceResponseBody
 from ..model.request_body import SeedanceRequestBody
+from ..utils.cache_utils import generate_cache_key
 
 
 class CacheMechanism:
-    """Implement caching for API responses"""
+    """Implement a bounded LRU cache for API responses"""
 
-    def __init__(self, max_size: int = 1000, ttl: int = 3600):
+    def __init__(self, max_size: int = 1024, ttl: int = 3600):
         """
         Initialize cache mechanism.
         
@@ -18,9 +21,16 @@ class CacheMechanism:
             max_size: Maximum number of items in cache
             ttl: Time-to-live for cache items in seconds
         """
-        self.cache: Dict[str, tuple] = {}  # cache_key -> (timestamp, response)
+        # cache_key -> (monotonic timestamp, response, raw response bytes or None),
+        # ordered from least to most recently used
+        self.cache: "OrderedDict[str, tuple]" = OrderedDict()
         self.max_size = max_size
         self.ttl = ttl
+        # (insertion timestamp, cache_key) min-heap, so expiry only touches expired entries;
+        # entries for keys since replaced or evicted are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # The client is shared between threads, and OrderedDict reordering is not atomic
+        self._lock = threading.Lock()
 
     def generate_cache_key(self, request_body: SeedanceRequestBody) -> Optional[str]:
         """
@@ -32,20 +42,7 @@ class CacheMechanism:
         Returns:
             Cache key string or None if request is not cacheable
         """
-        # Only cache deterministic requests (temperature = 0)
-        if getattr(request_body, 'temperature', None) != 0:
-            return None
-
-        cacheable_params = ('prompt', 'model', 'max_tokens', 'temperature')
-        cache_data = {}
-        for param in cacheable_params:
-            if hasattr(request_body, param):
-                value = getattr(request_body, param)
-                if value is not None:
-                    cache_data[param] = value
-        
-        cache_str = str(sorted(cache_data.items()))
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        return generate_cache_key(request_body)
 
     def get_cached_response(self, cache_key: str) -> Optional[SeedanceResponseBody]:
         """
@@ -57,43 +54,96 @@ class CacheMechanism:
         Returns:
             Cached response or None if not found or expired
         """
-        if cache_key in self.cache:
-            timestamp, response = self.cache[cache_key]
+        entry = self._get_live_entry(cache_key)
+        return entry[1] if entry is not None else None
+
+    def get_cached_bytes(self, cache_key: str) -> Optional[bytes]:
+        """
+        Get the raw JSON body of a cached response, for passing it on without re-serializing.
+        
+        Args:
+            cache_key: Key to look up in cache
+            
+        Returns:
+            Raw response bytes, or None if not found, expired or cached without them
+        """
+        entry = self._get_live_entry(cache_key)
+        return entry[2] if entry is not None else None
+
+    def _get_live_entry(self, cache_key: str) -> Optional[tuple]:
+        """
+        Get an unexpired cache entry and mark it as most recently used.
+        
+        Args:
+            cache_key: Key to look up in cache
+            
+        Returns:
+            Cache entry tuple or None if not found or expired
+        """
+        with self._lock:
+            entry = self.cache.get(cache_key)
+            if entry is None:
+                return None
             # Check if cache is still valid based on TTL
-            if time.time() - timestamp < self.ttl:
-                return response
-            else:
-                # Remove expired entry
-                del self.cache[cache_key]
+            if time.monotonic() - entry[0] < self.ttl:
+                # Mark as most recently used
+                self.cache.move_to_end(cache_key)
+                return entry
+            # Remove expired entry
+            del self.cache[cache_key]
         return None
 
-    def set_cache_response(self, cache_key: str, response: SeedanceResponseBody):
+    def set_cache_response(self, cache_key: str, response: SeedanceResponseBody, raw: Optional[bytes] = None):
         """
         Store response in cache.
         
         Args:
             cache_key: Key to store response under
             response: Response to cache
+            raw: Raw JSON body the response was parsed from, kept for get_cached_bytes
         """
         if cache_key:
-            # Check if we need to evict oldest entries due to size limit
-            if len(self.cache) >= self.max_size:
-                # Remove oldest entry (by timestamp)
-                oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k][0])
-                del self.cache[oldest_key]
-            
-            self.cache[cache_key] = (time.time(), response)
+            with self._lock:
+                now = time.monotonic()
+                if cache_key not in self.cache and len(self.cache) >= self.max_size:
+                    # Free space from expired entries before evicting live ones
+                    self._pop_expired(now)
+                self.cache[cache_key] = (now, response, raw)
+                self.cache.move_to_end(cache_key)
+                heapq.heappush(self._expiry_heap, (now, cache_key))
+                # Evict least recently used entries due to size limit
+                while len(self.cache) > self.max_size:
+                    self.cache.popitem(last=False)
+                # Drop stale heap entries once they outnumber live ones
+                if len(self._expiry_heap) > 2 * len(self.cache) + 64:
+                    self._expiry_heap = [(entry[0], key) for key, entry in self.cache.items()]
+                    heapq.heapify(self._expiry_heap)
 
     def clear_cache(self):
         """Clear all cached entries."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+            self._expiry_heap.clear()
 
     def remove_expired_entries(self):
         """Remove all expired cache entries."""
-        current_time = time.time()
-        expired_keys = [
-            key for key, (timestamp, _) in self.cache.items()
-            if current_time - timestamp >= self.ttl
-        ]
-        for key in expired_keys:
-            del self.cache[key]
\ No newline at end of file
+        with self._lock:
+            self._pop_expired(time.monotonic())
+
+    def _pop_expired(self, now: float):
+        """
+        Remove expired entries, oldest first, stopping at the first live one.
+
+        Must be called with the lock held.
+
+        Args:
+            now: Current monotonic time
+        """
+        heap = self._expiry_heap
+        ttl = self.ttl
+        while heap and now - heap[0][0] >= ttl:
+            timestamp, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Only delete if the entry was not re-inserted after this heap entry was pushed
+            if entry is not None and entry[0] == timestamp:
+                del self.cache[key]
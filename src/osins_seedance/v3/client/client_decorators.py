@@ -7,35 +7,32 @@ from functools import wraps
 from requests.exceptions import RequestException
 from typing import List
 from ..model.response_body import SeedanceResponseBody
-from ..utils.retry_utils import retry_on_failure
+from .retry_mechanism import retry_on_failure, DEFAULT_RETRY_ON_FAILURE_STATUS_CODES
 
 
 def log_api_call(func):
     """
     Decorator to log API calls with timing information.
     """
+    logger = logging.getLogger(__name__)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(__name__)
-        
-        # Log the API call
-        start_time = time.time()
-        
-        # Try to extract prompt from arguments for logging
-        prompt = "Unknown"
-        for arg in args:
-            if hasattr(arg, 'prompt'):
-                prompt = getattr(arg, 'prompt', 'Unknown')[:50]
-                if len(getattr(arg, 'prompt', '')) > 50:
-                    prompt += '...'
-                break
-        
-        logger.info(f"Making API call with prompt: {prompt}")
+        # Only build the prompt preview when INFO records will be emitted
+        if logger.isEnabledFor(logging.INFO):
+            prompt = "Unknown"
+            for arg in args:
+                if hasattr(arg, 'prompt'):
+                    prompt = getattr(arg, 'prompt', None) or ''
+                    if len(prompt) > 50:
+                        prompt = prompt[:50] + '...'
+                    break
+            logger.info("Making API call with prompt: %s", prompt)
 
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
 
-        duration = time.time() - start_time
-        logger.info(f"API call completed in {duration:.2f}s")
+        logger.info("API call completed in %.2fs", time.perf_counter() - start_time)
 
         return result
     return wrapper
@@ -114,7 +111,7 @@ def retry_with_backoff(max_retries=3, backoff_factor=1.0, status_codes=None):
         status_codes: HTTP status codes that should trigger a retry
     """
     if status_codes is None:
-        status_codes = [502, 503, 504]
+        status_codes = DEFAULT_RETRY_ON_FAILURE_STATUS_CODES
     
-    # Use the retry_on_failure decorator from utils
+    # Use the retry_on_failure decorator from the retry mechanism
     return retry_on_failure(max_retries, backoff_factor, status_codes)
\ No newline at end of file
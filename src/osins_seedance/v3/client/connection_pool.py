@@ -1,15 +1,24 @@
 """Connection pool management for API requests"""
 
+import os
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Optional
+from .retry_mechanism import create_retry_strategy
+
+
+# Large enough for a default ThreadPoolExecutor-style fan-out (five workers per CPU)
+DEFAULT_POOL_MAXSIZE = max(50, (os.cpu_count() or 4) * 5)
 
 
 class ConnectionPoolManager:
     """Manage connection pooling for API requests"""
 
-    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20, max_retries: int = 3):
+    __slots__ = ("pool_connections", "pool_maxsize", "max_retries", "pool_block", "_session")
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, max_retries: int = 3,
+                 pool_block: bool = True):
         """
         Initialize connection pool manager.
         
@@ -17,41 +26,64 @@ class ConnectionPoolManager:
             pool_connections: Number of connection pools
             pool_maxsize: Maximum number of connections in pool
             max_retries: Maximum number of retries for failed requests
+            pool_block: Wait for a pooled connection when all are in use instead of opening
+                a throwaway connection that is discarded afterwards
         """
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
         self.max_retries = max_retries
+        self.pool_block = pool_block
+        # Session handed out by get_session(), built on first use
+        self._session: Optional[requests.Session] = None
+
+    def get_session(self) -> requests.Session:
+        """
+        Get this manager's shared session, creating it on first use.
+
+        Every caller gets the same session, so its pooled keep-alive connections are
+        reused instead of each caller paying for new TCP/TLS handshakes.
 
-    def create_session(self) -> requests.Session:
+        Returns:
+            Shared requests.Session object
+        """
+        if self._session is None:
+            self._session = self.create_session()
+        return self._session
+
+    def create_session(self, retry_strategy: Optional[Retry] = None) -> requests.Session:
         """
-        Create a requests session with connection pooling configured.
+        Create a new requests session with connection pooling configured.
+
+        Each session owns its own pool; use get_session() to reuse one across calls.
         
+        Args:
+            retry_strategy: Retry strategy for the pooled adapter; if None, a default strategy is used
+            
         Returns:
             Configured requests.Session object
         """
         session = requests.Session()
         
         # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
-        )
+        if retry_strategy is None:
+            retry_strategy = create_retry_strategy(total=self.max_retries)
         
-        # Create adapter with connection pooling settings
+        # Create a single adapter with connection pooling settings
         adapter = HTTPAdapter(
             pool_connections=self.pool_connections,
             pool_maxsize=self.pool_maxsize,
-            max_retries=retry_strategy
+            max_retries=retry_strategy,
+            pool_block=self.pool_block
         )
         
         # Mount adapters for HTTP and HTTPS
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
-        # Set default headers
+        # Set default headers; the API only speaks JSON, so ask for it explicitly
         session.headers.update({
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept": "application/json"
         })
         
         return session
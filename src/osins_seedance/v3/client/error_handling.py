@@ -1,15 +1,63 @@
 """Complex error classification and handling for API requests"""
 
 import logging
+from functools import lru_cache
 from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
 from typing import Dict, Any, Optional
 from ..model.response_body import SeedanceResponseBody
 from ..utils.enums import APIErrorType
 
 
+# HTTP status codes reported as server errors
+SERVER_ERROR_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Exception classes in the order they are matched; HTTPError maps to None because
+# its error type depends on the response status code
+_EXCEPTION_ERROR_TYPES = (
+    (ValueError, APIErrorType.VALIDATION_ERROR),
+    (ConnectionError, APIErrorType.NETWORK_ERROR),
+    (Timeout, APIErrorType.NETWORK_ERROR),
+    (HTTPError, None),
+)
+
+# Error types for HTTPError status codes; other codes are validation errors
+_STATUS_ERROR_TYPES = {
+    401: APIErrorType.AUTHENTICATION_ERROR,
+    429: APIErrorType.RATE_LIMIT_ERROR,
+    **{code: APIErrorType.SERVER_ERROR for code in SERVER_ERROR_STATUS_CODES},
+}
+
+
+# Longest response body kept in an error's details; error pages can be large HTML documents
+MAX_ERROR_DETAILS_LENGTH = 4096
+
+# Error type strings compared or reported on every handled error
+_VALIDATION_ERROR = APIErrorType.VALIDATION_ERROR.value
+_RATE_LIMIT_ERROR = APIErrorType.RATE_LIMIT_ERROR.value
+
+
+@lru_cache(maxsize=128)
+def _error_type_for_class(exception_class: type) -> Optional[APIErrorType]:
+    """
+    Map an exception class to its error type, memoized since few distinct classes occur.
+
+    Args:
+        exception_class: Class of the exception being classified
+
+    Returns:
+        APIErrorType for the class, or None for HTTPError subclasses
+    """
+    for base, error_type in _EXCEPTION_ERROR_TYPES:
+        if issubclass(exception_class, base):
+            return error_type
+    return APIErrorType.NETWORK_ERROR
+
+
 class ErrorHandling:
     """Handle complex error classification and processing"""
 
+    __slots__ = ("logger",)
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
@@ -23,24 +71,11 @@ class ErrorHandling:
         Returns:
             Appropriate APIErrorType
         """
-        if isinstance(e, ValueError):
-            return APIErrorType.VALIDATION_ERROR
-        elif isinstance(e, ConnectionError):
-            return APIErrorType.NETWORK_ERROR
-        elif isinstance(e, Timeout):
-            return APIErrorType.NETWORK_ERROR
-        elif isinstance(e, HTTPError):
-            status_code = getattr(e.response, 'status_code', None)
-            if status_code == 401:
-                return APIErrorType.AUTHENTICATION_ERROR
-            elif status_code == 429:
-                return APIErrorType.RATE_LIMIT_ERROR
-            elif status_code in [500, 502, 503, 504]:
-                return APIErrorType.SERVER_ERROR
-            else:
-                return APIErrorType.VALIDATION_ERROR
-        else:
-            return APIErrorType.NETWORK_ERROR
+        error_type = _error_type_for_class(type(e))
+        if error_type is not None:
+            return error_type
+        status_code = getattr(e.response, 'status_code', None)
+        return _STATUS_ERROR_TYPES.get(status_code, APIErrorType.VALIDATION_ERROR)
 
     def handle_request_exception(self, e: RequestException, operation: str = "") -> SeedanceResponseBody:
         """
@@ -53,16 +88,18 @@ class ErrorHandling:
         Returns:
             Error response object
         """
-        self.logger.error(f"Request error during {operation}: {str(e)}")
+        self.logger.error("Request error during %s: %s", operation, e)
 
         error_details = ""
         status_code = None
-        if hasattr(e, 'response') and e.response is not None:
+        response = getattr(e, 'response', None)
+        if response is not None:
             try:
-                error_details = e.response.text
-                status_code = e.response.status_code
+                error_details = response.text
+                status_code = response.status_code
             except Exception:
-                error_details = str(getattr(e.response, 'text', ''))
+                error_details = str(getattr(response, 'text', ''))
+            error_details = error_details[:MAX_ERROR_DETAILS_LENGTH]
 
         # Determine error type based on the exception
         error_type = self.classify_error(e)
@@ -87,13 +124,12 @@ class ErrorHandling:
         Returns:
             Error response object
         """
-        self.logger.error(f"General error during {operation}: {str(e)}")
-
-        error_type = self.classify_error(e)
+        self.logger.error("General error during %s: %s", operation, e)
 
+        # Only ValueErrors keep their classification; everything else is reported as unknown
         return SeedanceResponseBody(
             error={
-                "type": error_type.value if isinstance(e, ValueError) else "unknown_error",
+                "type": _VALIDATION_ERROR if isinstance(e, ValueError) else "unknown_error",
                 "message": str(e)
             }
         )
@@ -106,10 +142,12 @@ class ErrorHandling:
             error_info: Dictionary containing error information
             context: Additional context to log with the error
         """
-        log_msg = f"API Error: {error_info.get('type', 'unknown')} - {error_info.get('message', 'No message')}"
+        error_type = error_info.get('type', 'unknown')
+        message = error_info.get('message', 'No message')
         if context:
-            log_msg += f" | Context: {context}"
-        self.logger.error(log_msg)
+            self.logger.error("API Error: %s - %s | Context: %s", error_type, message, context)
+        else:
+            self.logger.error("API Error: %s - %s", error_type, message)
 
     def should_retry_error(self, error_response: SeedanceResponseBody) -> bool:
         """
@@ -129,7 +167,21 @@ class ErrorHandling:
         error_type = error_info.get('type')
 
         # Retry on server errors and rate limit errors
-        if status_code in [500, 502, 503, 504] or error_type == APIErrorType.RATE_LIMIT_ERROR.value:
+        if status_code in SERVER_ERROR_STATUS_CODES or error_type == _RATE_LIMIT_ERROR:
             return True
 
-        return False
\ No newline at end of file
+        return False
+
+
+# Shared handler behind the module-level helpers below
+_default_error_handling = ErrorHandling()
+
+
+def handle_request_exception(e: RequestException, operation: str = "") -> SeedanceResponseBody:
+    """Helper function to handle request exceptions."""
+    return _default_error_handling.handle_request_exception(e, operation)
+
+
+def handle_general_exception(e: Exception, operation: str = "") -> SeedanceResponseBody:
+    """Helper function to handle general exceptions."""
+    return _default_error_handling.handle_general_exception(e, operation)
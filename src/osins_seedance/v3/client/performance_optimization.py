@@ -1,15 +1,32 @@
 """Performance optimization features for API clients"""
 
 import time
-from typing import Callable, Any
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, Deque, Dict, Optional, Tuple
 import functools
+from urllib3.util.request import ACCEPT_ENCODING
 
 
 class PerformanceOptimization:
     """Implement performance optimizations for API clients"""
 
-    def __init__(self):
-        self.metrics = {}
+    __slots__ = ("max_samples", "metrics", "_stats", "logger")
+
+    def __init__(self, max_samples: int = 1024):
+        """
+        Initialize performance metrics storage.
+
+        Args:
+            max_samples: Number of most recent execution times kept per function
+        """
+        self.max_samples = max_samples
+        # Recent execution times per function, bounded so long-running clients do not grow
+        self.metrics: Dict[str, Deque[float]] = {}
+        # Running (total time, call count) per function over all calls
+        self._stats: Dict[str, Tuple[float, int]] = {}
+        self.logger = logging.getLogger(__name__)
 
     def measure_execution_time(self, func: Callable) -> Callable:
         """
@@ -23,18 +40,21 @@ class PerformanceOptimization:
         """
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             
             # Store metrics
             func_name = func.__name__
-            if func_name not in self.metrics:
-                self.metrics[func_name] = []
-            self.metrics[func_name].append(execution_time)
-            
-            print(f"{func_name} executed in {execution_time:.4f} seconds")
+            samples = self.metrics.get(func_name)
+            if samples is None:
+                samples = self.metrics[func_name] = deque(maxlen=self.max_samples)
+            samples.append(execution_time)
+            total, count = self._stats.get(func_name, (0.0, 0))
+            self._stats[func_name] = (total + execution_time, count + 1)
+
+            self.logger.debug("%s executed in %.4f seconds", func_name, execution_time)
             return result
         return wrapper
 
@@ -48,10 +68,8 @@ class PerformanceOptimization:
         Returns:
             Average execution time in seconds
         """
-        if func_name in self.metrics and self.metrics[func_name]:
-            times = self.metrics[func_name]
-            return sum(times) / len(times)
-        return 0.0
+        total, count = self._stats.get(func_name, (0.0, 0))
+        return total / count if count else 0.0
 
     def get_total_calls(self, func_name: str) -> int:
         """
@@ -63,40 +81,44 @@ class PerformanceOptimization:
         Returns:
             Total number of calls
         """
-        return len(self.metrics.get(func_name, []))
+        return self._stats.get(func_name, (0.0, 0))[1]
 
     def cleanup_metrics(self):
         """Clean up stored metrics."""
         self.metrics.clear()
+        self._stats.clear()
 
-    def batch_requests(self, requests_list: list, batch_size: int = 10) -> list:
+    def batch_requests(self, requests_list: list, batch_size: int = 10, max_workers: Optional[int] = None) -> list:
         """
-        Batch multiple requests together to improve performance.
+        Run multiple requests concurrently, at most batch_size at a time.
         
         Args:
-            requests_list: List of requests to batch
-            batch_size: Size of each batch
+            requests_list: List of zero-argument callables performing the requests
+            batch_size: Maximum number of requests in flight at once
+            max_workers: Thread count to use instead of batch_size, e.g. the client's connection pool size
             
         Returns:
-            List of responses
+            List of responses, in the same order as requests_list
         """
-        results = []
-        for i in range(0, len(requests_list), batch_size):
-            batch = requests_list[i:i + batch_size]
-            # Process batch (this is a simplified version)
-            batch_results = [req() for req in batch]  # Execute each request in batch
-            results.extend(batch_results)
-        return results
+        if not requests_list:
+            return []
+        workers = max_workers or batch_size
+        # The requests are I/O bound, so threads overlap their round trips
+        with ThreadPoolExecutor(max_workers=min(workers, len(requests_list))) as executor:
+            return list(executor.map(lambda req: req(), requests_list))
 
     def enable_compression(self, session):
         """
         Enable compression for session requests.
+
+        Advertises every encoding urllib3 can decode here, which adds Brotli (br)
+        and Zstandard (zstd) to gzip/deflate when their optional packages are installed.
         
         Args:
             session: requests.Session object to enable compression for
         """
         session.headers.update({
-            'Accept-Encoding': 'gzip, deflate'
+            'Accept-Encoding': ACCEPT_ENCODING
         })
 
     def set_connection_keep_alive(self, session):
@@ -3,33 +3,72 @@
 import time
 import random
 import logging
+from functools import wraps
 from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 from urllib3.util.retry import Retry
+from ..model.response_body import SeedanceResponseBody
 
 
-def create_retry_strategy():
-    """Create a retry strategy with specific configurations."""
+logger = logging.getLogger(__name__)
+
+# Retried by the pooled adapter; shared by every Retry object instead of rebuilt per session
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"HEAD", "GET", "OPTIONS", "POST"})
+
+# Upper bound in seconds for a single backoff delay, however many attempts have failed
+MAX_BACKOFF = 60.0
+
+# Status codes retried by retry_on_failure when none are given
+DEFAULT_RETRY_ON_FAILURE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+def create_retry_strategy(total: int = 3, backoff_factor: float = 0.5):
+    """
+    Create a retry strategy with specific configurations.
+
+    The adapter retries failed connections (the request never reached the server, so this
+    is safe for POST) and 429/5xx responses. It never resends a request after a read
+    timeout or a dropped response, since the server may already have acted on it; read
+    timeouts surface as requests.ReadTimeout and are retried, if at all, by the caller.
+
+    Args:
+        total: Maximum number of retries performed by the adapter
+        backoff_factor: Factor for urllib3's exponential backoff between retries
+
+    Returns:
+        Configured urllib3 Retry object
+    """
     return Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],  # Status codes to retry
-        allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]  # Methods to retry
+        total=total,
+        backoff_factor=backoff_factor,
+        read=False,  # Re-raise read errors as-is instead of resending the request
+        status_forcelist=RETRY_STATUS_CODES,  # Status codes to retry
+        allowed_methods=RETRY_METHODS,  # Methods to retry
+        respect_retry_after_header=True,  # Honor server-provided Retry-After on 429/503
+        raise_on_status=False  # Return the last response so raise_for_status keeps the status code
     )
 
 
-def exponential_backoff_delay(attempt: int, backoff_factor: float = 1.0) -> float:
+def exponential_backoff_delay(attempt: int, backoff_factor: float = 1.0, max_backoff: float = MAX_BACKOFF,
+                              jitter: bool = True) -> float:
     """
-    Calculate delay for exponential backoff.
+    Calculate delay for exponential backoff with full jitter.
+
+    The delay is drawn uniformly from [0, min(max_backoff, backoff_factor * 2 ** attempt)], so
+    clients retrying the same failure spread out instead of retrying in lockstep.
     
     Args:
         attempt: Current attempt number (0-indexed)
         backoff_factor: Factor to multiply the exponential delay
+        max_backoff: Upper bound for the delay in seconds
+        jitter: Randomize the delay; if False the capped exponential delay is returned
         
     Returns:
         Delay in seconds
     """
-    delay = backoff_factor * (2 ** attempt) + random.uniform(0, 1)
-    return delay
+    delay = min(max_backoff, backoff_factor * (1 << attempt))
+    return random.uniform(0, delay) if jitter else delay
 
 
 def apply_retry_to_session(session, retry_strategy=None):
@@ -45,4 +84,58 @@ def apply_retry_to_session(session, retry_strategy=None):
     
     adapter = HTTPAdapter(max_retries=retry_strategy)
     session.mount("http://", adapter)
-    session.mount("https://", adapter)
\ No newline at end of file
+    session.mount("https://", adapter)
+
+
+def retry_on_failure(max_retries=3, backoff_factor=1.0, status_codes=None, max_backoff=MAX_BACKOFF, jitter=True):
+    """
+    Decorator to implement retry logic with exponential backoff.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+        backoff_factor: Factor for exponential backoff
+        status_codes: HTTP status codes that should trigger a retry
+        max_backoff: Upper bound in seconds for a single backoff delay
+        jitter: Randomize delays (full jitter); disable for deterministic waits in tests
+    """
+    if status_codes is None:
+        status_codes = DEFAULT_RETRY_ON_FAILURE_STATUS_CODES
+    else:
+        # Snapshot caller-supplied codes for O(1) membership checks on every attempt
+        status_codes = frozenset(status_codes)
+    
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    response = func(*args, **kwargs)
+
+                    # Check if the response has a status_code attribute or if we can determine status
+                    if hasattr(response, 'status_code') and response.status_code in status_codes:
+                        if attempt < max_retries:
+                            sleep_time = exponential_backoff_delay(attempt, backoff_factor, max_backoff, jitter)
+                            logger.warning("Attempt %d failed with status %s, retrying in %.2fs",
+                                           attempt + 1, response.status_code, sleep_time)
+                            time.sleep(sleep_time)
+                            continue
+                    elif isinstance(response, SeedanceResponseBody) and response.error:
+                        # If it's an error response, check if it's a server error that warrants retrying
+                        error_details = response.error.get('status_code', None)
+                        if error_details in status_codes and attempt < max_retries:
+                            sleep_time = exponential_backoff_delay(attempt, backoff_factor, max_backoff, jitter)
+                            logger.warning("Server error on attempt %d, retrying in %.2fs", attempt + 1, sleep_time)
+                            time.sleep(sleep_time)
+                            continue
+
+                    return response
+                except RequestException as e:
+                    if attempt == max_retries:
+                        logger.error("Max retries reached after %d attempts: %s", max_retries + 1, e)
+                        raise e
+                    sleep_time = exponential_backoff_delay(attempt, backoff_factor, max_backoff, jitter)
+                    logger.warning("Request failed on attempt %d, retrying in %.2fs: %s", attempt + 1, sleep_time, e)
+                    time.sleep(sleep_time)
+            return response
+        return wrapper
+    return decorator
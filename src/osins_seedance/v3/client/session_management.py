@@ -1,15 +1,19 @@
 """Session management for API clients"""
 
 import requests
+from requests.utils import default_headers
 from typing import Optional, Dict, Any
-from ..client.connection_pool import ConnectionPoolManager
-from ..client.retry_mechanism import apply_retry_to_session, create_retry_strategy
+from ..client.connection_pool import ConnectionPoolManager, DEFAULT_POOL_MAXSIZE
+from ..client.retry_mechanism import create_retry_strategy
 
 
 class SessionManagement:
     """Manage sessions for API requests"""
 
-    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20, max_retries: int = 3):
+    __slots__ = ("connection_pool_manager",)
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, max_retries: int = 3,
+                 pool_block: bool = True):
         """
         Initialize session management.
         
@@ -17,11 +21,13 @@ class SessionManagement:
             pool_connections: Number of connection pools
             pool_maxsize: Maximum number of connections in pool
             max_retries: Maximum number of retries for failed requests
+            pool_block: Wait for a free pooled connection instead of opening an extra one
         """
         self.connection_pool_manager = ConnectionPoolManager(
             pool_connections=pool_connections,
             pool_maxsize=pool_maxsize,
-            max_retries=max_retries
+            max_retries=max_retries,
+            pool_block=pool_block
         )
 
     def create_session(self, additional_headers: Optional[Dict[str, Any]] = None) -> requests.Session:
@@ -34,11 +40,11 @@ class SessionManagement:
         Returns:
             Managed requests.Session object
         """
-        session = self.connection_pool_manager.create_session()
-        
-        # Apply retry strategy to the session
-        retry_strategy = create_retry_strategy()
-        apply_retry_to_session(session, retry_strategy)
+        # Hand the retry strategy to the pool manager so it is mounted on the
+        # pooled adapter; mounting a second adapter would discard the pool sizing
+        session = self.connection_pool_manager.create_session(
+            create_retry_strategy(total=self.connection_pool_manager.max_retries)
+        )
         
         # Add any additional headers
         if additional_headers:
@@ -63,9 +69,10 @@ class SessionManagement:
             session: Session to reset
             additional_headers: New headers to add to the session
         """
-        # Clear existing headers except for the content-type
+        # Reset to the requests defaults (keep-alive, gzip) plus the content-type;
+        # clearing them outright would make the server close or skip compressing responses
         content_type = session.headers.get('Content-Type')
-        session.headers.clear()
+        session.headers = default_headers()
         if content_type:
             session.headers['Content-Type'] = content_type
         
@@ -76,6 +83,10 @@ class SessionManagement:
     def copy_session(self, original_session: requests.Session) -> requests.Session:
         """
         Create a copy of an existing session with the same configuration.
+
+        The copy mounts the original's adapters, so both sessions share one
+        connection pool (and its open keep-alive connections) and retry strategy.
+        Closing either session closes the shared pool.
         
         Args:
             original_session: Session to copy
@@ -85,14 +96,12 @@ class SessionManagement:
         """
         new_session = requests.Session()
         
-        # Copy headers
-        new_session.headers.update(original_session.headers)
-        
-        # Copy cookies
-        new_session.cookies.update(original_session.cookies)
+        # Copy headers and cookies so later changes to either session stay independent
+        new_session.headers = original_session.headers.copy()
+        new_session.cookies = original_session.cookies.copy()
         
-        # Apply the same connection pooling and retry strategy
-        retry_strategy = create_retry_strategy()
-        apply_retry_to_session(new_session, retry_strategy)
+        # Share the pooled adapters instead of starting with an empty pool
+        for prefix, adapter in original_session.adapters.items():
+            new_session.mount(prefix, adapter)
         
         return new_session
\ No newline at end of file
@@ -3,39 +3,82 @@
 import os
 import time
 import hashlib
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+from urllib.parse import urlsplit
+from requests import Response
 from requests.sessions import Session
-from requests.exceptions import ConnectionError, Timeout
+from requests.exceptions import ReadTimeout, RequestException
 from ..model.request_body import SeedanceRequestBody
 from ..model.response_body import SeedanceResponseBody
-from ..model.video_generation_request_body import VideoGenerationRequestBody
+from ..model.video_generation_request_body import VideoGenerationRequestBody, VIDEO_GENERATION_REQUEST_ADAPTER
 from ..model.video_generation_response_body import VideoGenerationResponseBody
-from ..config.config import get_v3_api_base_url
+from ..config.config import get_v3_api_base_url, get_timeout_schedule
 from ..utils.validation_utils import ConfigValidator
-from ..utils.cache_utils import generate_cache_key, get_cached_response, set_cache_response
-from ..utils.error_utils import handle_request_exception, handle_general_exception
-from ..utils.retry_utils import retry_on_failure
+from ..utils.common_utils import load_environment_variables
 from .base_client import BaseClient
-from .connection_pool import ConnectionPoolManager
 from .cache_mechanism import CacheMechanism
 from .error_handling import ErrorHandling
 from .session_management import SessionManagement
+from .connection_pool import DEFAULT_POOL_MAXSIZE
 from .performance_optimization import PerformanceOptimization
 import logging
 
+logger = logging.getLogger(__name__)
+
+
+# The video generation tasks endpoint lives on the Ark host rather than under base_url
+VIDEO_GENERATION_TASKS_URL = "https://ark.cn-beijing.volces.com/api/v3/contents/generations/tasks"
+
+# Read timeout in seconds for creating a video generation task
+VIDEO_GENERATION_READ_TIMEOUT = 60
+
+
+def _origin(url: str) -> str:
+    """
+    Get the scheme and host of a URL, which is what urllib3 keys its connection pools on.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        URL of the form scheme://host[:port]
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
 
 class VolcesClient:
     """Enhanced API client with all features: connection pooling, retry logic, caching, and better error handling"""
 
-    def __init__(self, api_key: str = None, base_url: str = None, timeout: int = 30):
+    def __init__(self, api_key: str = None, base_url: str = None, timeout: int = 30, connect_timeout: float = 5,
+                 timeout_schedule: Optional[Sequence[float]] = None, warm_up: bool = False,
+                 pool_connections: int = 10, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_block: bool = True,
+                 cache_max_size: int = 1024, cache_ttl: int = 3600):
         """
         Initialize the Volces API client.
 
         Args:
             api_key: API key for authentication; defaults to VOLCES_API_KEY env var
             base_url: Base URL for the API; defaults to environment or default URL
-            timeout: Request timeout in seconds
+            timeout: Request (read) timeout in seconds
+            connect_timeout: Connection timeout in seconds
+            timeout_schedule: Read timeouts for successive attempts after a read timeout, e.g. (5, 15, 60),
+                so early attempts fail fast and the last one tolerates tail latency;
+                defaults to VOLCES_TIMEOUT_SCHEDULE env var or a single attempt with `timeout`.
+                Video task creation is not idempotent and is always sent once
+            warm_up: Open a pooled connection to the API in the background on construction
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum connections kept per host; set it to the expected number of
+                concurrent calls, since extra requests open connections that are not reused
+            pool_block: Make requests beyond pool_maxsize wait for a free connection rather
+                than opening and discarding extra connections
+            cache_max_size: Maximum number of deterministic (temperature 0) responses to cache
+            cache_ttl: Seconds a cached response stays valid
         """
+        # Settings below may come from a .env file, which is read once per process on first use
+        load_environment_variables()
         self.api_key = api_key or os.getenv("VOLCES_API_KEY")
         # If base_url is explicitly provided as parameter, use it as-is
         if base_url:
@@ -44,25 +87,59 @@ class VolcesClient:
             # Use centralized function to get v3 API base URL
             self.base_url = get_v3_api_base_url()  # Version path is fixed for v3 API
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        # Endpoint URLs are fixed for the client's lifetime, so build them once
+        self._url_generate = f"{self.base_url}/generate"
+        self._url_models = f"{self.base_url}/models"
+        self.timeout_schedule = tuple(timeout_schedule or get_timeout_schedule() or (timeout,))
 
         # Validate configuration
         ConfigValidator.validate_api_key(self.api_key)
         ConfigValidator.validate_base_url(self.base_url)
 
         # Initialize components
-        self.connection_pool_manager = ConnectionPoolManager()
-        self.cache_mechanism = CacheMechanism()
+        self.cache_mechanism = CacheMechanism(max_size=cache_max_size, ttl=cache_ttl)
         self.error_handling = ErrorHandling()
-        self.session_management = SessionManagement()
+        self.session_management = SessionManagement(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
         self.performance_optimization = PerformanceOptimization()
 
-        # Configure session with retry strategy and connection pooling
-        self.session = self.session_management.create_session({
-            "Content-Type": "application/json"
-        })
+        # Configure a pooled keep-alive session with retry strategy, reused for every call.
+        # Its adapter is the only layer that retries 429/5xx responses, so a failing call
+        # is not re-run from the top (validation, cache lookup, serialization) on each retry.
+        # The auth headers are constant for the client's lifetime, so they are set once here
+        # and merged by requests into every request instead of being rebuilt per call.
+        self.session = self.session_management.create_session(self._get_auth_headers())
+
+        if warm_up:
+            self.warm_up()
+
+    def warm_up(self) -> threading.Thread:
+        """
+        Prime the connection pool with HEAD requests on a background thread.
+
+        The first real call then reuses an established keep-alive connection
+        instead of paying for the TCP and TLS handshakes on the critical path.
+        urllib3 pools connections per host, and video tasks are created on a different
+        host than base_url, so each distinct origin is warmed, video tasks first.
+
+        Returns:
+            The started daemon thread
+        """
+        # dict.fromkeys drops the duplicate when base_url is on the video tasks host
+        origins = list(dict.fromkeys((_origin(VIDEO_GENERATION_TASKS_URL), _origin(self.base_url))))
+
+        def _head():
+            for origin in origins:
+                try:
+                    self.session.head(origin, timeout=(self.connect_timeout, 3))
+                except RequestException as e:
+                    logger.debug("Connection warm-up of %s failed: %s", origin, e)
 
-        # Initialize cache
-        self._cache = {}
+        thread = threading.Thread(target=_head, name="volces-warm-up", daemon=True)
+        thread.start()
+        return thread
 
     def _get_auth_headers(self) -> dict:
         """Helper method to get authentication headers."""
@@ -71,7 +148,35 @@ class VolcesClient:
             "Content-Type": "application/json"
         }
 
-    @retry_on_failure(max_retries=3, backoff_factor=1.0, status_codes=[502, 503, 504])
+    def _send_with_timeout_schedule(self, send: Callable[..., Response], url: str,
+                                    read_timeouts: Sequence[float], **kwargs) -> Response:
+        """
+        Send an idempotent request, retrying read timeouts with the next (longer) read timeout.
+
+        This loop is the only layer that retries read timeouts: the session adapter
+        re-raises them without resending. Connection failures (including connect timeouts)
+        and 429/5xx responses are retried by the adapter alone, so they are not retried here.
+
+        Args:
+            send: Session method to call, e.g. self.session.get
+            url: URL to send the request to
+            read_timeouts: Read timeout in seconds for each successive attempt
+            **kwargs: Additional arguments for the session method
+
+        Returns:
+            Response from the API
+        """
+        last_attempt = len(read_timeouts) - 1
+        for attempt, read_timeout in enumerate(read_timeouts):
+            try:
+                return send(url, timeout=(self.connect_timeout, read_timeout), **kwargs)
+            except ReadTimeout:
+                if attempt == last_attempt:
+                    raise
+                sleep_time = min(0.5 * (2 ** attempt), 8)
+                logger.warning("Attempt %d timed out after %ss, retrying in %.2fs", attempt + 1, read_timeout, sleep_time)
+                time.sleep(sleep_time)
+
     def call_volces_api(self, request_body: SeedanceRequestBody) -> SeedanceResponseBody:
         """
         Call the Volces API with the given request body.
@@ -82,12 +187,13 @@ class VolcesClient:
         Returns:
             Response body from the API
         """
-        logger = logging.getLogger(__name__)
-
         # Log the API call
-        logger.info(f"Making API call with prompt: {request_body.prompt[:50]}{'...' if len(request_body.prompt) > 50 else ''}")
+        if logger.isEnabledFor(logging.INFO):
+            prompt = request_body.prompt
+            logger.info("Making API call with prompt: %.50s%s", prompt, '...' if len(prompt) > 50 else '')
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        succeeded = False
 
         try:
             # Validate input
@@ -100,52 +206,66 @@ class VolcesClient:
                 )
                 return error_response
 
-            # Check cache for deterministic requests
-            cache_key = self.cache_mechanism.generate_cache_key(request_body)
-            cached_response = self.cache_mechanism.get_cached_response(cache_key)
-            if cached_response:
-                logger.info("Returning cached response")
-                duration = time.time() - start_time
-                logger.info(f"API call completed via cache in {duration:.2f}s")
-                return cached_response
-
-            headers = self._get_auth_headers()
-
-            response = self.session.post(
-                f"{self.base_url}/generate",
-                headers=headers,
-                json=request_body.model_dump(),
-                timeout=self.timeout
+            # Check cache for deterministic requests; the default temperature is not
+            # cacheable, so most calls skip the key generation and lookup entirely
+            cache_key = None
+            if request_body.temperature == 0:
+                cache_key = self.cache_mechanism.generate_cache_key(request_body)
+                cached_response = self.cache_mechanism.get_cached_response(cache_key)
+                if cached_response:
+                    logger.info("Returning cached response")
+                    succeeded = True
+                    return cached_response
+
+            response = self._send_with_timeout_schedule(
+                self.session.post,
+                self._url_generate,
+                self.timeout_schedule,
+                # Serialized once per request body and reused across retries
+                data=request_body.json_bytes
             )
 
-            duration = time.time() - start_time
-            logger.info(f"API call completed in {duration:.2f}s with status {response.status_code}")
+            logger.info("API call returned status %s", response.status_code)
 
             # Check for HTTP errors
             response.raise_for_status()
 
-            # Parse response JSON
-            response_json = response.json()
-
-            # Create response model
-            result = SeedanceResponseBody(**response_json)
+            # Parse and validate the raw body bytes in one pydantic-core pass
+            result = SeedanceResponseBody.model_validate_json(response.content)
 
             # Cache deterministic responses
             if cache_key:
-                self.cache_mechanism.set_cache_response(cache_key, result)
+                self.cache_mechanism.set_cache_response(cache_key, result, response.content)
 
+            succeeded = True
             return result
 
+        except RequestException as e:
+            return self.error_handling.handle_request_exception(e, "call_volces_api")
         except Exception as e:
-            duration = time.time() - start_time
-            if isinstance(e, (ConnectionError, Timeout)):
-                logger.error(f"API call failed after {duration:.2f}s with connection/timeout error: {str(e)}")
-                return self.error_handling.handle_request_exception(e, "call_volces_api")
+            return self.error_handling.handle_general_exception(e, "call_volces_api")
+        finally:
+            # Single duration measurement for every exit path; error details are logged by the handlers
+            duration = time.perf_counter() - start_time
+            if succeeded:
+                logger.info("API call completed in %.2fs", duration)
             else:
-                logger.error(f"API call failed after {duration:.2f}s with unexpected error: {str(e)}")
-                return self.error_handling.handle_general_exception(e, "call_volces_api")
+                logger.error("API call failed after %.2fs", duration)
+
+    def call_volces_api_many(self, request_bodies: Sequence[SeedanceRequestBody],
+                             max_workers: Optional[int] = None) -> List[SeedanceResponseBody]:
+        """
+        Send several generation requests concurrently over the pooled session.
+
+        Args:
+            request_bodies: Request bodies to send
+            max_workers: Maximum number of concurrent requests; defaults to the connection pool size
+
+        Returns:
+            Responses in the same order as request_bodies
+        """
+        return self._call_concurrently(self.call_volces_api, request_bodies, max_workers)
 
-    @retry_on_failure(max_retries=3, backoff_factor=1.0, status_codes=[502, 503, 504])
     def call_video_generation_api(self, request_body: VideoGenerationRequestBody) -> VideoGenerationResponseBody:
         """
         Call the Volces Video Generation API with the given request body.
@@ -156,13 +276,14 @@ class VolcesClient:
         Returns:
             Response body from the API with task ID
         """
-        logger = logging.getLogger(__name__)
-
         # Log the API call
-        text_content = next((item.text for item in request_body.content if item.type == "text"), "No text content")
-        logger.info(f"Making video generations API call with model: {request_body.model}, text: {text_content[:50]}{'...' if len(text_content) > 50 else ''}")
+        if logger.isEnabledFor(logging.INFO):
+            text_content = next((item.text for item in request_body.content if item.type == "text"), "No text content")
+            logger.info("Making video generations API call with model: %s, text: %.50s%s",
+                        request_body.model, text_content, '...' if len(text_content) > 50 else '')
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        succeeded = False
 
         try:
             # Validate input
@@ -176,42 +297,75 @@ class VolcesClient:
                 )
                 return error_response
 
-            headers = self._get_auth_headers()
-
-            # Use the specific video generation endpoint
-            api_url = "https://ark.cn-beijing.volces.com/api/v3/contents/generations/tasks"
-            
+            # Task creation is not idempotent: a read timeout may already have created the task,
+            # so it is sent once; the adapter only retries connections that were never established
             response = self.session.post(
-                api_url,
-                headers=headers,
-                json=request_body.model_dump(exclude_unset=True),
-                timeout=60  # 60 seconds timeout for video generation
+                VIDEO_GENERATION_TASKS_URL,
+                data=VIDEO_GENERATION_REQUEST_ADAPTER.dump_json(request_body, exclude_unset=True),
+                timeout=(self.connect_timeout, VIDEO_GENERATION_READ_TIMEOUT)
             )
 
-            duration = time.time() - start_time
-            logger.info(f"Video generations API call completed in {duration:.2f}s with status {response.status_code}")
+            logger.info("Video generations API call returned status %s", response.status_code)
 
             # Check for HTTP errors
             response.raise_for_status()
 
-            # Parse response JSON
-            response_json = response.json()
-
-            # Create response model
-            result = VideoGenerationResponseBody(**response_json)
+            # Parse and validate the raw body bytes in one pydantic-core pass
+            result = VideoGenerationResponseBody.model_validate_json(response.content)
 
+            succeeded = True
             return result
 
+        except RequestException as e:
+            return self.error_handling.handle_request_exception(e, "call_video_generation_api")
         except Exception as e:
-            duration = time.time() - start_time
-            if isinstance(e, (ConnectionError, Timeout)):
-                logger.error(f"Video generation API call failed after {duration:.2f}s with connection/timeout error: {str(e)}")
-                return self.error_handling.handle_request_exception(e, "call_video_generation_api")
+            return self.error_handling.handle_general_exception(e, "call_video_generation_api")
+        finally:
+            # Single duration measurement for every exit path; error details are logged by the handlers
+            duration = time.perf_counter() - start_time
+            if succeeded:
+                logger.info("Video generations API call completed in %.2fs", duration)
             else:
-                logger.error(f"Video generation API call failed after {duration:.2f}s with unexpected error: {str(e)}")
-                return self.error_handling.handle_general_exception(e, "call_video_generation_api")
+                logger.error("Video generations API call failed after %.2fs", duration)
+
+    def call_video_generation_api_many(self, request_bodies: Sequence[VideoGenerationRequestBody],
+                                       max_workers: Optional[int] = None) -> List[VideoGenerationResponseBody]:
+        """
+        Submit several video generation tasks concurrently.
+
+        The calls share the client's pooled keep-alive session, so N tasks take
+        roughly one round trip of wall time instead of N sequential ones.
+
+        Args:
+            request_bodies: Request bodies for the video generation tasks
+            max_workers: Maximum number of concurrent requests; defaults to the connection pool size
+
+        Returns:
+            Responses in the same order as request_bodies
+        """
+        return self._call_concurrently(self.call_video_generation_api, request_bodies, max_workers)
+
+    def _call_concurrently(self, call: Callable, request_bodies: Sequence, max_workers: Optional[int]) -> list:
+        """
+        Run an API call for each request body on a thread pool sized to the connection pool.
+
+        Args:
+            call: Client method to call with each request body
+            request_bodies: Request bodies to send
+            max_workers: Maximum number of concurrent requests; defaults to the connection pool size
+
+        Returns:
+            Results in the same order as request_bodies
+        """
+        if not request_bodies:
+            return []
+
+        if max_workers is None:
+            max_workers = self.session_management.connection_pool_manager.pool_maxsize
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(request_bodies))) as executor:
+            return list(executor.map(call, request_bodies))
 
-    @retry_on_failure(max_retries=3, backoff_factor=1.0, status_codes=[502, 503, 504])
     def get_volces_models(self) -> SeedanceResponseBody:
         """
         Get available models from Volces API.
@@ -219,41 +373,40 @@ class VolcesClient:
         Returns:
             Response body containing available models
         """
-        logger = logging.getLogger(__name__)
-        
-        logger.info(f"Fetching models from {self.base_url}/models")
+        logger.info("Fetching models from %s", self._url_models)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        succeeded = False
 
         try:
-            headers = self._get_auth_headers()
-
-            response = self.session.get(
-                f"{self.base_url}/models",
-                headers=headers,
-                timeout=self.timeout
+            response = self._send_with_timeout_schedule(
+                self.session.get,
+                self._url_models,
+                self.timeout_schedule
             )
 
-            duration = time.time() - start_time
-            logger.info(f"Models fetch completed in {duration:.2f}s with status {response.status_code}")
+            logger.info("Models fetch returned status %s", response.status_code)
 
             # Check for HTTP errors
             response.raise_for_status()
 
-            # Parse response JSON
-            response_json = response.json()
+            # Parse and validate the raw body bytes in one pydantic-core pass
+            result = SeedanceResponseBody.model_validate_json(response.content)
 
-            # Return as response model
-            return SeedanceResponseBody(**response_json)
+            succeeded = True
+            return result
 
+        except RequestException as e:
+            return self.error_handling.handle_request_exception(e, "get_volces_models")
         except Exception as e:
-            duration = time.time() - start_time
-            if isinstance(e, (ConnectionError, Timeout)):
-                logger.error(f"Models fetch failed after {duration:.2f}s with connection/timeout error: {str(e)}")
-                return self.error_handling.handle_request_exception(e, "get_volces_models")
+            return self.error_handling.handle_general_exception(e, "get_volces_models")
+        finally:
+            # Single duration measurement for every exit path; error details are logged by the handlers
+            duration = time.perf_counter() - start_time
+            if succeeded:
+                logger.info("Models fetch completed in %.2fs", duration)
             else:
-                logger.error(f"Models fetch failed after {duration:.2f}s with unexpected error: {str(e)}")
-                return self.error_handling.handle_general_exception(e, "get_volces_models")
+                logger.error("Models fetch failed after %.2fs", duration)
 
     def close(self):
         """Close the client session and clean up resources."""
@@ -1,14 +1,34 @@
 """Configuration utilities for v3 API."""
 
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
 from ...config import get_api_base_host
 
 
+@lru_cache(maxsize=1)
 def get_v3_api_base_url() -> str:
     """
     Get the unified base URL for v3 API
 
+    Cached alongside get_api_base_host; clear both caches to pick up a new host.
+
     Returns:
         Base URL for v3 API, in the format {base_host}/v3
     """
     base_host = get_api_base_host()
-    return f"{base_host}/v3"
\ No newline at end of file
+    return f"{base_host}/v3"
+
+
+def get_timeout_schedule() -> Optional[Tuple[float, ...]]:
+    """
+    Get the per-attempt read timeout schedule
+
+    Returns:
+        Read timeouts in seconds for successive attempts, parsed from the
+        comma-separated VOLCES_TIMEOUT_SCHEDULE env var, or None if it is not set
+    """
+    schedule = os.getenv("VOLCES_TIMEOUT_SCHEDULE")
+    if not schedule:
+        return None
+    return tuple(float(value) for value in schedule.split(","))
@@ -1,9 +1,9 @@
 """Request body model for Volces API v3 with strict validation"""
 
+from functools import cached_property
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from pydantic.config import ConfigDict
-import re
 
 
 class SeedanceRequestBody(BaseModel):
@@ -32,29 +32,34 @@ class SeedanceRequestBody(BaseModel):
             raise ValueError('Prompt cannot be empty or just whitespace')
         return v.strip()
 
-    @field_validator('model')
-    @classmethod
-    def validate_model(cls, v):
-        if v is not None:
-            # Validate model name format (alphanumeric, hyphens, underscores, dots)
-            if not re.match(r'^[\w\-_.]+$', v):
-                raise ValueError('Model name can only contain alphanumeric characters, hyphens, underscores, and dots')
-        return v
-
     @field_validator('stop')
     @classmethod
     def validate_stop_sequences(cls, v):
+        # The number of stop sequences is limited by Field(max_length=4)
         if v is not None:
-            if len(v) > 4:  # Limit the number of stop sequences
-                raise ValueError('Maximum of 4 stop sequences allowed')
             for seq in v:
                 if len(seq) > 100:
                     raise ValueError('Stop sequences must be less than 100 characters')
         return v
 
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """UTF-8 JSON payload, serialized once and reused by retries and repeated sends"""
+        return SEEDANCE_REQUEST_ADAPTER.dump_json(self)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "SeedanceRequestBody":
+        copied = super().model_copy(update=update, deep=deep)
+        # The copy inherits the cached payload, which is stale once fields are updated
+        copied.__dict__.pop('json_bytes', None)
+        return copied
+
     model_config = ConfigDict(
         # Allow extra fields in case API adds new parameters
         extra="allow",
-        # Strict validation
-        validate_assignment=True
-    )
\ No newline at end of file
+        # Request bodies are immutable once validated, which keeps json_bytes in sync
+        frozen=True
+    )
+
+
+# Built once at import; dump_json serializes a request straight to UTF-8 bytes
+SEEDANCE_REQUEST_ADAPTER = TypeAdapter(SeedanceRequestBody)
@@ -1,15 +1,15 @@
 """Response body model for Volces API v3 with strict validation"""
 
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
-import re
 
 
 class SeedanceResponseBody(BaseModel):
     """Response body model for Volces API calls with strict validation"""
 
-    # Standard API response fields
+    # Standard API response fields; the id format (alphanumeric, hyphens, underscores, dots)
+    # is checked by pydantic-core's compiled pattern rather than a Python validator
     id: Optional[str] = Field(default=None, pattern=r'^[\w\-_.]+$', description="Unique identifier for the response")
     object: Optional[str] = Field(default=None, description="Type of the response object")
     created: Optional[int] = Field(default=None, ge=0, description="Unix timestamp of creation")
@@ -18,18 +18,10 @@ class SeedanceResponseBody(BaseModel):
     usage: Optional[Dict[str, Any]] = Field(default=None, description="Usage statistics")
     error: Optional[Dict[str, Any]] = Field(default=None, description="Error information if any")
 
-    @field_validator('id')
-    @classmethod
-    def validate_id(cls, v):
-        if v is not None:
-            # Validate ID format (alphanumeric, hyphens, underscores, dots)
-            if not re.match(r'^[\w\-_.]+$', v):
-                raise ValueError('ID can only contain alphanumeric characters, hyphens, underscores, and dots')
-        return v
-
     model_config = ConfigDict(
         # Allow extra fields in case API returns additional data
         extra="allow",
-        # Strict validation
-        validate_assignment=True
-    )
\ No newline at end of file
+        # Responses are built once from validated JSON; re-running the validators
+        # (including the id pattern) on every attribute write is pure overhead
+        validate_assignment=False
+    )
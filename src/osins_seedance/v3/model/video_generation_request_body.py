@@ -1,11 +1,20 @@
 """Request body model for Volces Video Generation API v3 with strict validation"""
 
-from typing import Optional, List, Union, Literal
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from typing import Any, Dict, Optional, List, Union, Literal
+from typing_extensions import Annotated  # typing.Annotated is Python 3.9+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from pydantic.config import ConfigDict
 import re
 
 
+# URL schemes accepted for callback URLs
+_HTTP_SCHEMES = ('http://', 'https://')
+
+# Valid frame counts: 25 + 4n within [29, 289]
+_ALLOWED_FRAMES = frozenset(range(29, 290, 4))
+
+
 class TextContent(BaseModel):
     """文本内容对象"""
     type: Literal["text"]
@@ -38,8 +47,9 @@ class DraftTaskContent(BaseModel):
     draft_task: DraftTaskObject
 
 
-# Union type for content items
-ContentItem = Union[TextContent, ImageContent, DraftTaskContent]
+# Union type for content items, discriminated by the "type" tag so pydantic-core picks
+# the member model directly instead of trying each one in turn
+ContentItem = Annotated[Union[TextContent, ImageContent, DraftTaskContent], Field(discriminator="type")]
 
 
 class VideoGenerationRequestBody(BaseModel):
@@ -49,36 +59,37 @@ class VideoGenerationRequestBody(BaseModel):
     model: str = Field(..., min_length=1, max_length=256, description="模型ID")
     content: List[ContentItem] = Field(..., min_length=1, max_length=10, description="输入给模型生成视频的信息")
 
-    # Optional fields
+    # Optional fields; those with a concrete default are not Optional, so None is rejected
+    # and pydantic-core runs a single type check instead of a None/value union
     callback_url: Optional[str] = Field(
         default=None, 
         max_length=2048, 
         description="填写本次生成任务结果的回调通知地址"
     )
     
-    return_last_frame: Optional[bool] = Field(
+    return_last_frame: bool = Field(
         default=False, 
         description="是否返回生成视频的尾帧图像"
     )
     
-    service_tier: Optional[Literal["default", "flex"]] = Field(
+    service_tier: Literal["default", "flex"] = Field(
         default="default", 
         description="服务等级：default(在线推理), flex(离线推理)"
     )
     
-    execution_expires_after: Optional[int] = Field(
+    execution_expires_after: int = Field(
         default=172800, 
         ge=3600, 
         le=259200, 
         description="任务超时阈值，单位秒，取值范围[3600, 259200]"
     )
     
-    generate_audio: Optional[bool] = Field(
+    generate_audio: bool = Field(
         default=True, 
         description="是否生成音频，仅Seedance 1.5 pro支持"
     )
     
-    draft: Optional[bool] = Field(
+    draft: bool = Field(
         default=False, 
         description="是否开启样片模式，仅Seedance 1.5 pro支持"
     )
@@ -106,19 +117,19 @@ class VideoGenerationRequestBody(BaseModel):
         description="视频帧数，支持[29, 289]区间内满足25+4n格式的值"
     )
     
-    seed: Optional[int] = Field(
+    seed: int = Field(
         default=-1, 
         ge=-1, 
         le=4294967295,  # 2^32 - 1
         description="种子整数，用于控制生成内容的随机性"
     )
     
-    camera_fixed: Optional[bool] = Field(
+    camera_fixed: bool = Field(
         default=False, 
         description="是否固定摄像头，参考图场景不支持"
     )
     
-    watermark: Optional[bool] = Field(
+    watermark: bool = Field(
         default=False, 
         description="生成视频是否包含水印"
     )
@@ -126,16 +137,17 @@ class VideoGenerationRequestBody(BaseModel):
     @field_validator('model')
     @classmethod
     def validate_model(cls, v):
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError('Model cannot be empty')
-        return v.strip()
+        return stripped
 
     @field_validator('callback_url')
     @classmethod
     def validate_callback_url(cls, v):
         if v is not None:
             # Basic URL validation
-            if not v.startswith(('http://', 'https://')):
+            if not v.startswith(_HTTP_SCHEMES):
                 raise ValueError('Callback URL must start with http:// or https://')
         return v
 
@@ -145,10 +157,24 @@ class VideoGenerationRequestBody(BaseModel):
         if not v or len(v) == 0:
             raise ValueError('Content must not be empty')
         
-        # Count different content types
-        text_count = sum(1 for item in v if item.type == "text")
-        image_count = sum(1 for item in v if item.type == "image_url")
-        draft_task_count = sum(1 for item in v if item.type == "draft_task")
+        # Count content types and image roles in a single pass over the items
+        text_count = image_count = draft_task_count = 0
+        first_frames = last_frames = reference_images = 0
+        for item in v:
+            item_type = item.type
+            if item_type == "text":
+                text_count += 1
+            elif item_type == "image_url":
+                image_count += 1
+                role = item.role
+                if role == "first_frame":
+                    first_frames += 1
+                elif role == "last_frame":
+                    last_frames += 1
+                elif role == "reference_image":
+                    reference_images += 1
+            elif item_type == "draft_task":
+                draft_task_count += 1
         
         # Validate content combinations
         if draft_task_count > 1:
@@ -159,29 +185,18 @@ class VideoGenerationRequestBody(BaseModel):
                 raise ValueError('draft_task cannot be combined with other content types')
         
         # Validate image roles
-        image_items = [item for item in v if item.type == "image_url"]
-        if image_items:
-            roles = [item.role for item in image_items if item.role is not None]
-            
-            # Check for conflicting roles
-            has_first_frame = "first_frame" in roles
-            has_reference_image = "reference_image" in roles
-            
-            if has_first_frame and has_reference_image:
-                raise ValueError('first_frame and reference_image roles cannot be mixed')
-            
-            # Validate first_frame/last_frame combination
-            first_frames = [role for role in roles if role == "first_frame"]
-            last_frames = [role for role in roles if role == "last_frame"]
-            
-            if len(first_frames) > 1:
-                raise ValueError('Only one first_frame image is allowed')
-            
-            if len(last_frames) > 1:
-                raise ValueError('Only one last_frame image is allowed')
-            
-            if len(first_frames) == 0 and len(last_frames) > 0:
-                raise ValueError('last_frame requires a corresponding first_frame')
+        if first_frames and reference_images:
+            raise ValueError('first_frame and reference_image roles cannot be mixed')
+        
+        # Validate first_frame/last_frame combination
+        if first_frames > 1:
+            raise ValueError('Only one first_frame image is allowed')
+        
+        if last_frames > 1:
+            raise ValueError('Only one last_frame image is allowed')
+        
+        if first_frames == 0 and last_frames > 0:
+            raise ValueError('last_frame requires a corresponding first_frame')
         
         return v
 
@@ -196,25 +211,33 @@ class VideoGenerationRequestBody(BaseModel):
     @field_validator('frames')
     @classmethod
     def validate_frames(cls, v):
-        if v is not None:
+        if v is not None and v not in _ALLOWED_FRAMES:
             # Check if frame count follows the pattern 25 + 4n where n is positive integer
             if v < 29 or v > 289:
                 raise ValueError('Frames must be between 29 and 289')
-            
-            if (v - 25) % 4 != 0:
-                raise ValueError('Frames must follow the pattern 25 + 4n where n is a positive integer')
-        
+            raise ValueError('Frames must follow the pattern 25 + 4n where n is a positive integer')
         return v
 
-    @field_validator('resolution', 'ratio', 'duration', 'frames', 'seed', 'camera_fixed', 'watermark')
-    @classmethod
-    def validate_video_params(cls, v):
-        # These are just pass-through validators since Pydantic handles the type validation
-        return v
+    @cached_property
+    def validation_result(self):
+        """Cross-field ValidationResult, computed once per request since request bodies are frozen"""
+        # Imported here because validation_utils imports this module
+        from ..utils.validation_utils import VideoGenerationValidator
+        return VideoGenerationValidator.comprehensive_validation(self)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "VideoGenerationRequestBody":
+        copied = super().model_copy(update=update, deep=deep)
+        # The copy inherits the cached result, which is stale once fields are updated
+        copied.__dict__.pop('validation_result', None)
+        return copied
 
     model_config = ConfigDict(
         # Allow extra fields in case API adds new parameters
         extra="allow",
-        # Strict validation
-        validate_assignment=True
-    )
\ No newline at end of file
+        # Request bodies are built once and sent, so they are immutable instead of re-validated on assignment
+        frozen=True
+    )
+
+
+# Built once at import; dump_json serializes a request straight to UTF-8 bytes
+VIDEO_GENERATION_REQUEST_ADAPTER = TypeAdapter(VideoGenerationRequestBody)
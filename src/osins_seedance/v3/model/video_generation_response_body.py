@@ -42,6 +42,6 @@ class VideoGenerationResponseBody(BaseModel):
     model_config = ConfigDict(
         # Allow extra fields in case API returns additional data
         extra="allow",
-        # Strict validation
-        validate_assignment=True
-    )
\ No newline at end of file
+        # Responses are read-only results, so they are immutable instead of re-validated on assignment
+        frozen=True
+    )
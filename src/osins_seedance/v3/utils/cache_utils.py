@@ -2,38 +2,52 @@
 
 import hashlib
 import time
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Optional, Tuple
 from ..model.response_body import SeedanceResponseBody
 
 
+# Request fields that determine a cacheable response, in a fixed order
+CACHEABLE_PARAMS = ('max_tokens', 'model', 'prompt', 'temperature')
+
+
+@lru_cache(maxsize=None)
+def _cache_key_reader(request_class: type) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build, once per request class, a function reading CACHEABLE_PARAMS in order"""
+    fields = getattr(request_class, 'model_fields', None)
+    if fields is not None and all(param in fields for param in CACHEABLE_PARAMS):
+        # Every parameter is a declared field, so a C-level attrgetter can read them all at once
+        return attrgetter(*CACHEABLE_PARAMS)
+    return lambda request_body: tuple(getattr(request_body, param, None) for param in CACHEABLE_PARAMS)
+
+
 def generate_cache_key(request_body) -> Optional[str]:
     """Generate a cache key based on request parameters"""
     # Only cache deterministic requests (temperature = 0)
     if getattr(request_body, 'temperature', None) != 0:
         return None
 
-    cacheable_params = ('prompt', 'model', 'max_tokens', 'temperature')
-    cache_data = {}
-    for param in cacheable_params:
-        if hasattr(request_body, param):
-            value = getattr(request_body, param)
-            if value is not None:
-                cache_data[param] = value
-    
-    cache_str = str(sorted(cache_data.items()))
-    return hashlib.md5(cache_str.encode()).hexdigest()
-
-
-def get_cached_response(cache_key: str, cache: dict) -> Optional[SeedanceResponseBody]:
-    """Get response from cache if available"""
-    if cache_key and cache_key in cache:
-        cached_at, response = cache[cache_key]
-        # Check if cache is still valid (for simplicity, we'll assume it's always valid for this example)
-        return response
+    # The parameters come back in the fixed CACHEABLE_PARAMS order, so no sorting is needed
+    values = _cache_key_reader(type(request_body))(request_body)
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+
+
+def get_cached_response(cache_key: str, cache: dict, ttl: float = 3600) -> Optional[SeedanceResponseBody]:
+    """Get response from cache if available and younger than ttl seconds"""
+    if cache_key:
+        entry = cache.pop(cache_key, None)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            # Re-insert so dict order tracks recency, oldest first
+            cache[cache_key] = entry
+            return entry[1]
     return None
 
 
-def set_cache_response(cache_key: str, response: SeedanceResponseBody, cache: dict):
-    """Store response in cache"""
+def set_cache_response(cache_key: str, response: SeedanceResponseBody, cache: dict, max_size: int = 1024):
+    """Store response in cache, evicting the least recently used entries beyond max_size"""
     if cache_key:
-        cache[cache_key] = (time.time(), response)
\ No newline at end of file
+        cache.pop(cache_key, None)
+        cache[cache_key] = (time.monotonic(), response)
+        while len(cache) > max_size:
+            del cache[next(iter(cache))]
@@ -1,12 +1,25 @@
 """Common utility functions"""
 
 import logging
-from dotenv import load_dotenv
+from functools import lru_cache
 import os
 
+# Set once the corresponding one-time setup has run in this process
+_logging_configured = False
+_environment_loaded = False
+
 
 def setup_logging():
-    """Configure logging for the module"""
+    """
+    Configure logging for the module (only the first call has any effect).
+
+    The library does not call this on import; applications that want the
+    default log format call it once at startup.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -14,13 +27,21 @@ def setup_logging():
 
 
 def load_environment_variables():
-    """Load environment variables from .env file"""
+    """Load environment variables from .env file (only the first call reads it)"""
+    global _environment_loaded
+    if _environment_loaded:
+        return
+    _environment_loaded = True
+    # Imported here so that importing the package does not pull in dotenv
+    from dotenv import load_dotenv
     load_dotenv()
 
 
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
-    """Get API key from environment variable"""
+    """Get API key from environment variable (cached; call get_api_key.cache_clear() after changing it)"""
+    load_environment_variables()
     api_key = os.getenv("VOLCES_API_KEY")
     if not api_key:
         raise ValueError("VOLCES_API_KEY environment variable is not set")
-    return api_key
\ No newline at end of file
+    return api_key
@@ -1,8 +1,27 @@
 """Validation utilities for video generation API models"""
 
-from typing import Dict, Any, List
-from ..model.video_generation_request_body import VideoGenerationRequestBody, ContentItem, TextContent, ImageContent, DraftTaskContent
-import re
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+from ..model.video_generation_request_body import VideoGenerationRequestBody
+
+
+# URL schemes accepted for API base URLs
+_HTTP_SCHEMES = ('http://', 'https://')
+
+
+@lru_cache(maxsize=256)
+def _model_family(model: str) -> Tuple[bool, bool]:
+    """
+    Classify a model id, memoized because requests reuse a handful of model ids.
+
+    Args:
+        model: Model id from the request body
+
+    Returns:
+        Tuple of (is Seedance 1.5 pro, is a lite model)
+    """
+    model_name = model.lower()
+    return "1-5-pro" in model_name or "1.5" in model_name, "lite" in model_name
 
 
 class ConfigValidator:
@@ -20,16 +39,23 @@ class ConfigValidator:
     @staticmethod
     def validate_base_url(base_url: str) -> bool:
         """Validate base URL format"""
-        if not base_url.startswith(('http://', 'https://')):
+        if not base_url.startswith(_HTTP_SCHEMES):
             raise ValueError("Base URL must start with http:// or https://")
         return True
 
 
+class ValidationResult(NamedTuple):
+    """Outcome of a validation pass; immutable so memoized results can be shared"""
+    valid: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...] = ()
+
+
 class VideoGenerationValidator:
     """Validation utilities for video generation API models"""
     
     @staticmethod
-    def validate_content_combinations(request_body: VideoGenerationRequestBody) -> Dict[str, Any]:
+    def validate_content_combinations(request_body: VideoGenerationRequestBody) -> ValidationResult:
         """
         Validate content combinations according to API documentation rules
         
@@ -40,188 +66,88 @@ class VideoGenerationValidator:
         """
         errors = []
         
-        # Count different content types
-        text_count = sum(1 for item in request_body.content if isinstance(item, TextContent))
-        image_count = sum(1 for item in request_body.content if isinstance(item, ImageContent))
-        draft_task_count = sum(1 for item in request_body.content if isinstance(item, DraftTaskContent))
+        reference_image_count = 0
+        for item in request_body.content:
+            if item.type == "image_url" and item.role == "reference_image":
+                reference_image_count += 1
         
-        # Validate draft_task rules
-        if draft_task_count > 1:
-            errors.append('Only one draft_task content item is allowed')
+        # The draft_task exclusivity and first_frame/last_frame/reference_image role rules
+        # are enforced by VideoGenerationRequestBody.validate_content, so a constructed
+        # request body already satisfies them; only the rule the model lacks is checked here
+        # Validate reference image count limits (1-4 for reference images)
+        if reference_image_count > 4:
+            errors.append('Reference images are limited to 1-4 images')
         
-        if draft_task_count == 1 and (text_count > 0 or image_count > 0):
-            errors.append('draft_task cannot be combined with other content types')
-        
-        # Validate image roles if present
-        if image_count > 0:
-            image_items = [item for item in request_body.content if isinstance(item, ImageContent)]
-            roles = [item.role for item in image_items if item.role is not None]
-            
-            # Check for conflicting roles
-            has_first_frame = "first_frame" in roles
-            has_last_frame = "last_frame" in roles
-            has_reference_image = "reference_image" in roles
-            
-            # Validate mutually exclusive roles
-            if has_first_frame and has_reference_image:
-                errors.append('first_frame and reference_image roles cannot be mixed (mutually exclusive)')
-            
-            # Validate first_frame/last_frame combination rules
-            first_frame_roles = [role for role in roles if role == "first_frame"]
-            last_frame_roles = [role for role in roles if role == "last_frame"]
-            reference_image_roles = [role for role in roles if role == "reference_image"]
-            
-            if len(first_frame_roles) > 1:
-                errors.append('Only one first_frame image is allowed')
-            
-            if len(last_frame_roles) > 1:
-                errors.append('Only one last_frame image is allowed')
-            
-            if len(first_frame_roles) == 0 and len(last_frame_roles) > 0:
-                errors.append('last_frame requires a corresponding first_frame')
-            
-            # Validate reference image count limits (1-4 for reference images)
-            if len(reference_image_roles) > 4:
-                errors.append('Reference images are limited to 1-4 images')
-        
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "summary": {
-                "text_content_count": text_count,
-                "image_content_count": image_count,
-                "draft_task_count": draft_task_count
-            }
-        }
+        return ValidationResult(not errors, tuple(errors))
     
     @staticmethod
-    def validate_video_parameters(request_body: VideoGenerationRequestBody) -> Dict[str, Any]:
+    def validate_video_parameters(request_body: VideoGenerationRequestBody) -> ValidationResult:
         """
         Validate video-specific parameters according to API documentation
         """
         errors = []
         
-        # Validate duration
-        if request_body.duration is not None:
-            if request_body.duration != -1 and (request_body.duration < 2 or request_body.duration > 12):
-                errors.append('Duration must be -1 or between 2 and 12 seconds')
-        
-        # Validate frames (only for non-1.5 pro models, but we'll validate the pattern anyway)
-        if request_body.frames is not None:
-            if request_body.frames < 29 or request_body.frames > 289:
-                errors.append('Frames must be between 29 and 289')
-            
-            if (request_body.frames - 25) % 4 != 0:
-                errors.append('Frames must follow the pattern 25 + 4n where n is a positive integer')
-        
-        # Validate seed range
-        if request_body.seed is not None:
-            if request_body.seed < -1 or request_body.seed > 4294967295:  # 2^32 - 1
-                errors.append('Seed must be between -1 and 2^32-1')
-        
-        # Validate resolution
-        if request_body.resolution is not None:
-            valid_resolutions = ["480p", "720p", "1080p"]
-            if request_body.resolution not in valid_resolutions:
-                errors.append(f'Resolution must be one of {valid_resolutions}')
-        
-        # Validate ratio
-        if request_body.ratio is not None:
-            valid_ratios = ["16:9", "4:3", "1:1", "3:4", "9:16", "21:9", "adaptive"]
-            if request_body.ratio not in valid_ratios:
-                errors.append(f'Ratio must be one of {valid_ratios}')
-        
-        # Validate service tier
-        if request_body.service_tier is not None:
-            valid_tiers = ["default", "flex"]
-            if request_body.service_tier not in valid_tiers:
-                errors.append(f'Service tier must be one of {valid_tiers}')
-        
-        # Validate execution_expires_after
-        if request_body.execution_expires_after is not None:
-            if request_body.execution_expires_after < 3600 or request_body.execution_expires_after > 259200:
-                errors.append('Execution expires after must be between 3600 and 259200 seconds')
+        # Ranges, the frames pattern and the allowed resolution/ratio/service tier values are
+        # enforced by the VideoGenerationRequestBody field constraints; only the cross-field
+        # rule the model cannot express is checked here
         
         # Validate camera_fixed with reference images (should not be used together)
-        if request_body.camera_fixed is not None and request_body.camera_fixed:
-            image_items = [item for item in request_body.content if isinstance(item, ImageContent)]
-            has_reference_images = any(item.role == "reference_image" for item in image_items)
+        if request_body.camera_fixed:
+            has_reference_images = any(
+                item.type == "image_url" and item.role == "reference_image" for item in request_body.content
+            )
             if has_reference_images:
                 errors.append('camera_fixed parameter is not supported with reference images')
         
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors
-        }
+        return ValidationResult(not errors, tuple(errors))
     
     @staticmethod
-    def validate_model_compatibility(request_body: VideoGenerationRequestBody) -> Dict[str, Any]:
+    def validate_model_compatibility(request_body: VideoGenerationRequestBody) -> ValidationResult:
         """
         Validate model-specific compatibility rules based on API documentation
         """
         errors = []
         warnings = []
         
-        model_name = request_body.model.lower()
+        is_pro_1_5, is_lite = _model_family(request_body.model)
         
         # Check for model-specific features
-        if "1-5-pro" in model_name or "1.5" in model_name:
-            # Seedance 1.5 pro specific validations
-            if request_body.generate_audio is not None:
-                # This is valid for 1.5 pro
-                pass
-            if request_body.draft is not None:
-                # This is valid for 1.5 pro
-                pass
+        if is_pro_1_5:
+            # Seedance 1.5 pro supports generate_audio and draft, so there is nothing to check
+            pass
         else:
             # For non-1.5 pro models, certain features may not be supported
             if request_body.generate_audio is False:  # If explicitly set to False
-                warnings.append(f'Model {model_name} may not support generate_audio parameter')
+                warnings.append(f'Model {request_body.model.lower()} may not support generate_audio parameter')
             if request_body.draft:
-                warnings.append(f'Model {model_name} may not support draft mode')
+                warnings.append(f'Model {request_body.model.lower()} may not support draft mode')
         
         # Check for lite model limitations
-        if "lite" in model_name:
+        if is_lite:
             # Lite models have specific limitations
             if request_body.resolution == "1080p":
-                image_items = [item for item in request_body.content if isinstance(item, ImageContent)]
-                has_reference_images = any(item.role == "reference_image" for item in image_items)
+                has_reference_images = any(
+                    item.type == "image_url" and item.role == "reference_image" for item in request_body.content
+                )
                 if has_reference_images:
-                    errors.append(f'Model {model_name} (lite) does not support 1080p resolution with reference images')
+                    errors.append(f'Model {request_body.model.lower()} (lite) does not support 1080p resolution with reference images')
         
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings
-        }
+        return ValidationResult(not errors, tuple(errors), tuple(warnings))
     
     @staticmethod
-    def comprehensive_validation(request_body: VideoGenerationRequestBody) -> Dict[str, Any]:
+    def comprehensive_validation(request_body: VideoGenerationRequestBody) -> ValidationResult:
         """
         Perform comprehensive validation of the request body
+
+        Per-phase results are available from the individual validators.
         """
         content_validation = VideoGenerationValidator.validate_content_combinations(request_body)
         parameter_validation = VideoGenerationValidator.validate_video_parameters(request_body)
         compatibility_validation = VideoGenerationValidator.validate_model_compatibility(request_body)
         
-        all_errors = (
-            content_validation["errors"] + 
-            parameter_validation["errors"] + 
-            compatibility_validation["errors"]
-        )
-        
-        all_warnings = compatibility_validation["warnings"]
+        all_errors = content_validation.errors + parameter_validation.errors + compatibility_validation.errors
         
-        return {
-            "valid": len(all_errors) == 0,
-            "errors": all_errors,
-            "warnings": all_warnings,
-            "details": {
-                "content_validation": content_validation,
-                "parameter_validation": parameter_validation,
-                "compatibility_validation": compatibility_validation
-            }
-        }
+        return ValidationResult(not all_errors, all_errors, compatibility_validation.warnings)
 
 
 def validate_video_generation_request(request_body: VideoGenerationRequestBody) -> bool:
@@ -229,5 +155,5 @@ def validate_video_generation_request(request_body: VideoGenerationRequestBody)
     Convenience function to validate a video generation request
     Returns True if valid, False otherwise
     """
-    result = VideoGenerationValidator.comprehensive_validation(request_body)
-    return result["valid"]
\ No newline at end of file
+    # Memoized on the frozen request, so retries and polling of the same object validate once
+    return request_body.validation_result.valid
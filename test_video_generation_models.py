@@ -38,13 +38,13 @@ def test_basic_text_generation():
     
     validation_result = VideoGenerationValidator.comprehensive_validation(request_body)
     
-    print(f"Valid: {validation_result['valid']}")
-    if not validation_result['valid']:
-        print(f"Errors: {validation_result['errors']}")
+    print(f"Valid: {validation_result.valid}")
+    if not validation_result.valid:
+        print(f"Errors: {validation_result.errors}")
     else:
         print("✓ Basic text generation test passed")
     
-    return validation_result['valid']
+    return validation_result.valid
 
 
 def test_image_to_video_first_frame():
@@ -70,13 +70,13 @@ def test_image_to_video_first_frame():
     
     validation_result = VideoGenerationValidator.comprehensive_validation(request_body)
     
-    print(f"Valid: {validation_result['valid']}")
-    if not validation_result['valid']:
-        print(f"Errors: {validation_result['errors']}")
+    print(f"Valid: {validation_result.valid}")
+    if not validation_result.valid:
+        print(f"Errors: {validation_result.errors}")
     else:
         print("✓ Image-to-video first frame test passed")
     
-    return validation_result['valid']
+    return validation_result.valid
 
 
 def test_image_to_video_first_last_frame():
@@ -107,13 +107,13 @@ def test_image_to_video_first_last_frame():
     
     validation_result = VideoGenerationValidator.comprehensive_validation(request_body)
     
-    print(f"Valid: {validation_result['valid']}")
-    if not validation_result['valid']:
-        print(f"Errors: {validation_result['errors']}")
+    print(f"Valid: {validation_result.valid}")
+    if not validation_result.valid:
+        print(f"Errors: {validation_result.errors}")
     else:
         print("✓ Image-to-video first-last frame test passed")
     
-    return validation_result['valid']
+    return validation_result.valid
 
 
 def test_reference_images():
@@ -144,13 +144,13 @@ def test_reference_images():
     
     validation_result = VideoGenerationValidator.comprehensive_validation(request_body)
     
-    print(f"Valid: {validation_result['valid']}")
-    if not validation_result['valid']:
-        print(f"Errors: {validation_result['errors']}")
+    print(f"Valid: {validation_result.valid}")
+    if not validation_result.valid:
+        print(f"Errors: {validation_result.errors}")
     else:
         print("✓ Reference image test passed")
     
-    return validation_result['valid']
+    return validation_result.valid
 
 
 def test_invalid_combinations():
@@ -206,13 +206,13 @@ def test_draft_task():
     
     validation_result = VideoGenerationValidator.comprehensive_validation(request_body)
     
-    print(f"Valid: {validation_result['valid']}")
-    if not validation_result['valid']:
-        print(f"Errors: {validation_result['errors']}")
+    print(f"Valid: {validation_result.valid}")
+    if not validation_result.valid:
+        print(f"Errors: {validation_result.errors}")
     else:
         print("✓ Draft task test passed")
     
-    return validation_result['valid']
+    return validation_result.valid
 
 
 def test_parameter_validation():
@@ -242,13 +242,13 @@ def test_parameter_validation():
     
     validation_result = VideoGenerationValidator.comprehensive_validation(request_body)
     
-    print(f"Valid: {validation_result['valid']}")
-    if not validation_result['valid']:
-        print(f"Errors: {validation_result['errors']}")
+    print(f"Valid: {validation_result.valid}")
+    if not validation_result.valid:
+        print(f"Errors: {validation_result.errors}")
     else:
         print("✓ Parameter validation test passed")
     
-    return validation_result['valid']
+    return validation_result.valid
 
 
 def main():
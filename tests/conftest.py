@@ -0,0 +1,39 @@
+"""Shared pytest fixtures"""
+
+import pytest
+import requests
+from src.osins_seedance.config import get_api_base_host
+from src.osins_seedance.v3.utils.common_utils import get_api_key
+from src.osins_seedance.v3.config.config import get_v3_api_base_url
+from src.osins_seedance.v3.api import api_v3_contents_generations_tasks as api
+
+
+@pytest.fixture(autouse=True)
+def clear_models_cache():
+    """Ensure every test fetches the model list instead of reusing another test's response"""
+    api.clear_models_cache()
+    yield
+    api.clear_models_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_environment_caches():
+    """Let tests that change VOLCES_BASE_HOST or VOLCES_API_KEY observe the new value"""
+    get_api_base_host.cache_clear()
+    get_v3_api_base_url.cache_clear()
+    get_api_key.cache_clear()
+    yield
+    get_api_base_host.cache_clear()
+    get_v3_api_base_url.cache_clear()
+    get_api_key.cache_clear()
+
+
+@pytest.fixture
+def make_response():
+    """Build a requests.Response with the given status code and body, as the session would return it"""
+    def _make_response(status_code=200, content=b""):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        return response
+    return _make_response
@@ -2,6 +2,7 @@
 
 import pytest
 import os
+import json
 from unittest.mock import patch, MagicMock
 from src.seedance.v3 import VolcesClient, SeedanceRequestBody, SeedanceResponseBody
 from src.seedance.v3.utils.enums import APIErrorType
@@ -59,7 +60,7 @@ class TestAdvancedVolcesClient:
             import requests
             response = MagicMock(spec=requests.Response)
             response.status_code = 200
-            response.json.return_value = {
+            response.content = json.dumps({
                 "id": "gen-123456",
                 "object": "text_completion",
                 "created": 1678886400,
@@ -76,7 +77,7 @@ class TestAdvancedVolcesClient:
                     "completion_tokens": 50,
                     "total_tokens": 60
                 }
-            }
+            }).encode()
             response.raise_for_status.return_value = None
             return response
 
@@ -112,7 +113,7 @@ class TestAdvancedVolcesClient:
             import requests
             response = MagicMock(spec=requests.Response)
             response.status_code = 200
-            response.json.return_value = {
+            response.content = json.dumps({
                 "object": "list",
                 "data": [
                     {
@@ -122,7 +123,7 @@ class TestAdvancedVolcesClient:
                         "owned_by": "volces"
                     }
                 ]
-            }
+            }).encode()
             response.raise_for_status.return_value = None
             return response
 
@@ -0,0 +1,68 @@
+"""Tests for the module-level v3 API functions"""
+
+import os
+from unittest.mock import patch
+from src.osins_seedance.v3 import VolcesClient, SeedanceResponseBody
+from src.osins_seedance.v3.api import api_v3_contents_generations_tasks as api
+
+
+class TestSharedClient:
+    """Tests for the shared client used by the API functions"""
+
+    def setup_method(self):
+        os.environ['VOLCES_API_KEY'] = 'test-key-longer-than-ten-chars'
+        api._close_client()
+
+    def teardown_method(self):
+        api._close_client()
+        del os.environ['VOLCES_API_KEY']
+
+    def test_client_is_reused_across_calls(self):
+        """Test that the API functions share one client and do not close it"""
+        first = api._get_client()
+        second = api._get_client()
+        assert first is second
+
+        with patch.object(first, 'close') as mock_close, \
+                patch.object(first, 'get_volces_models') as mock_get:
+            api.get_seedance_models()
+            api.get_seedance_models()
+
+        assert mock_get.call_count == 2
+        mock_close.assert_not_called()
+        assert api._get_client() is first
+
+
+class TestModelsCache:
+    """Tests for the TTL cache on the model list"""
+
+    def setup_method(self):
+        os.environ['VOLCES_API_KEY'] = 'test-key-longer-than-ten-chars'
+
+    def teardown_method(self):
+        api._close_client()
+        del os.environ['VOLCES_API_KEY']
+
+    def test_successful_models_response_is_cached(self):
+        """Test that a successful model list is served from cache until it expires"""
+        with patch.object(VolcesClient, 'get_volces_models') as mock_get:
+            mock_get.return_value = SeedanceResponseBody(object="list")
+
+            first = api.get_seedance_models()
+            second = api.get_seedance_models()
+            assert first is second
+            assert mock_get.call_count == 1
+
+            with patch.object(api, '_MODELS_TTL', 0):
+                api.get_seedance_models()
+            assert mock_get.call_count == 2
+
+    def test_error_response_is_not_cached(self):
+        """Test that failed model fetches are retried on the next call"""
+        with patch.object(VolcesClient, 'get_volces_models') as mock_get:
+            mock_get.return_value = SeedanceResponseBody(error={"type": "network_error", "message": "down"})
+
+            api.get_seedance_models()
+            api.get_seedance_models()
+
+        assert mock_get.call_count == 2
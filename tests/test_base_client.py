@@ -0,0 +1,38 @@
+"""Tests for the persistent session used by BaseClient"""
+
+import pytest
+import requests
+from unittest.mock import patch
+from src.osins_seedance.v3.client.base_client import BaseClient
+
+
+class TestBaseClientSession:
+    """Tests for session reuse and request dispatch in BaseClient"""
+
+    def test_requests_reuse_one_session(self, monkeypatch):
+        """Test that every method goes through the same session with auth headers set once"""
+        client = BaseClient(api_key='test-key-longer-than-ten-chars', base_url='https://example.com/v3')
+        calls = []
+        monkeypatch.setattr(client.session, 'request', lambda *args, **kwargs: calls.append((args, kwargs)))
+
+        client.make_request("/tasks", method="post", data={"a": 1})
+        client.make_request("/tasks/1", method="GET")
+
+        assert calls == [
+            (("POST", "https://example.com/v3/tasks"), {"data": b'{"a":1}', "timeout": 30}),
+            (("GET", "https://example.com/v3/tasks/1"), {"timeout": 30}),
+        ]
+        assert client.session.headers["Authorization"] == "Bearer test-key-longer-than-ten-chars"
+
+    def test_unsupported_method_raises(self):
+        """Test that unknown HTTP methods are rejected"""
+        client = BaseClient(api_key='test-key-longer-than-ten-chars')
+        with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+            client.make_request("/tasks", method="PATCH")
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the with block closes the session"""
+        with patch.object(requests.Session, 'close') as mock_close:
+            with BaseClient(api_key='test-key-longer-than-ten-chars') as client:
+                assert isinstance(client, BaseClient)
+        mock_close.assert_called_once()
@@ -0,0 +1,80 @@
+"""Tests for the bounded LRU response cache"""
+
+from unittest.mock import patch
+from src.osins_seedance.v3 import SeedanceRequestBody, SeedanceResponseBody
+from src.osins_seedance.v3.client.cache_mechanism import CacheMechanism
+
+
+class TestCacheMechanism:
+    """Tests for eviction, expiry and interning in CacheMechanism"""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that a cache hit protects an entry from eviction"""
+        cache_mechanism = CacheMechanism(max_size=2)
+        cache_mechanism.set_cache_response("a", SeedanceResponseBody(id="a"))
+        cache_mechanism.set_cache_response("b", SeedanceResponseBody(id="b"))
+
+        # Touch "a" so that "b" becomes the least recently used entry
+        assert cache_mechanism.get_cached_response("a").id == "a"
+        cache_mechanism.set_cache_response("c", SeedanceResponseBody(id="c"))
+
+        assert cache_mechanism.get_cached_response("b") is None
+        assert cache_mechanism.get_cached_response("a").id == "a"
+        assert cache_mechanism.get_cached_response("c").id == "c"
+
+    def test_remove_expired_entries_keeps_fresh_entries_in_order(self):
+        """Test that the sweep drops expired entries and preserves LRU order of the rest"""
+        cache_mechanism = CacheMechanism(ttl=10)
+        with patch('time.monotonic', return_value=100.0):
+            cache_mechanism.set_cache_response("old", SeedanceResponseBody(id="old"))
+        with patch('time.monotonic', return_value=105.0):
+            cache_mechanism.set_cache_response("b", SeedanceResponseBody(id="b"))
+            cache_mechanism.set_cache_response("a", SeedanceResponseBody(id="a"))
+
+        with patch('time.monotonic', return_value=111.0):
+            cache_mechanism.remove_expired_entries()
+
+        assert list(cache_mechanism.cache) == ["b", "a"]
+
+    def test_full_cache_frees_expired_entries_before_evicting_live_ones(self):
+        """Test that an insert into a full cache drops expired entries instead of the LRU live one"""
+        cache_mechanism = CacheMechanism(max_size=2, ttl=10)
+        with patch('time.monotonic', return_value=100.0):
+            cache_mechanism.set_cache_response("live", SeedanceResponseBody(id="live"))
+            cache_mechanism.set_cache_response("expiring", SeedanceResponseBody(id="expiring"))
+        with patch('time.monotonic', return_value=105.0):
+            # Re-inserting refreshes the timestamp, so the older heap entry must not remove it
+            cache_mechanism.set_cache_response("live", SeedanceResponseBody(id="live"))
+        with patch('time.monotonic', return_value=111.0):
+            cache_mechanism.set_cache_response("new", SeedanceResponseBody(id="new"))
+
+        assert list(cache_mechanism.cache) == ["live", "new"]
+
+    def test_expiry_heap_stays_bounded(self):
+        """Test that repeated inserts of the same keys do not grow the expiry heap without bound"""
+        cache_mechanism = CacheMechanism(max_size=4)
+        response = SeedanceResponseBody(id="a")
+        for i in range(1000):
+            cache_mechanism.set_cache_response(f"key-{i % 4}", response)
+
+        assert len(cache_mechanism._expiry_heap) <= 2 * len(cache_mechanism.cache) + 65
+
+    def test_mutating_one_entry_leaves_identical_entries_alone(self):
+        """Test that keys with identical payloads hold separate responses"""
+        cache_mechanism = CacheMechanism()
+        cache_mechanism.set_cache_response("a", SeedanceResponseBody(id="same"), b'{"id": "same"}')
+        cache_mechanism.set_cache_response("b", SeedanceResponseBody(id="same"), b'{"id": "same"}')
+
+        cache_mechanism.get_cached_response("a").model = "changed"
+
+        assert cache_mechanism.get_cached_response("b").model is None
+
+    def test_cache_key_depends_only_on_cacheable_fields(self):
+        """Test that equal requests share a key and a changed field changes it"""
+        cache_mechanism = CacheMechanism()
+        first = SeedanceRequestBody(prompt="a cat", model="volces-v3", temperature=0)
+        same = SeedanceRequestBody(prompt="a cat", model="volces-v3", temperature=0)
+        other = SeedanceRequestBody(prompt="a dog", model="volces-v3", temperature=0)
+
+        assert cache_mechanism.generate_cache_key(first) == cache_mechanism.generate_cache_key(same)
+        assert cache_mechanism.generate_cache_key(first) != cache_mechanism.generate_cache_key(other)
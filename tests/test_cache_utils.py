@@ -0,0 +1,29 @@
+"""Tests for the dict-based cache helpers in cache_utils"""
+
+from types import SimpleNamespace
+from src.osins_seedance.v3 import SeedanceRequestBody, SeedanceResponseBody
+from src.osins_seedance.v3.utils.cache_utils import generate_cache_key, get_cached_response, set_cache_response
+
+
+class TestCacheUtils:
+    """Tests for cache keys and the dict cache helpers"""
+
+    def test_helpers_bound_size_and_honor_ttl(self):
+        """Test that the helpers evict the least recently used entry and drop expired ones"""
+        cache = {}
+        set_cache_response("a", SeedanceResponseBody(id="a"), cache, max_size=2)
+        set_cache_response("b", SeedanceResponseBody(id="b"), cache, max_size=2)
+        assert get_cached_response("a", cache).id == "a"
+        set_cache_response("c", SeedanceResponseBody(id="c"), cache, max_size=2)
+
+        assert list(cache) == ["a", "c"]
+        assert get_cached_response("a", cache, ttl=0) is None
+        assert "a" not in cache
+
+    def test_cache_key_for_plain_objects_matches_model(self):
+        """Test that objects without model fields fall back to reading attributes with defaults"""
+        plain = SimpleNamespace(prompt="a cat", model="volces-v3", max_tokens=100, temperature=0.0)
+        model = SeedanceRequestBody(prompt="a cat", model="volces-v3", temperature=0)
+
+        assert generate_cache_key(plain) == generate_cache_key(model)
+        assert generate_cache_key(SimpleNamespace(temperature=0)) is not None
@@ -0,0 +1,17 @@
+"""Tests for the client decorators"""
+
+from types import SimpleNamespace
+from src.osins_seedance.v3.client.client_decorators import log_api_call
+
+
+class TestLogApiCall:
+    """Tests for the log_api_call decorator"""
+
+    def test_long_prompt_is_truncated(self, caplog):
+        """Test that the logged prompt preview is capped at 50 characters"""
+        call = log_api_call(lambda body: "done")
+        with caplog.at_level("INFO"):
+            assert call(SimpleNamespace(prompt="x" * 60)) == "done"
+
+        assert f"prompt: {'x' * 50}..." in caplog.text
+        assert "API call completed in" in caplog.text
@@ -0,0 +1,45 @@
+"""Tests for environment and logging helpers in common_utils"""
+
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch
+from src.osins_seedance.v3.utils.common_utils import get_api_key
+
+
+class TestEnvironmentCaching:
+    """Tests for resolving environment settings once per process"""
+
+    def test_api_key_is_resolved_once(self):
+        """Test that get_api_key keeps the first value until the cache is cleared"""
+        with patch.dict(os.environ, {'VOLCES_API_KEY': 'first-key-value'}):
+            assert get_api_key() == 'first-key-value'
+            os.environ['VOLCES_API_KEY'] = 'second-key-value'
+            assert get_api_key() == 'first-key-value'
+            get_api_key.cache_clear()
+            assert get_api_key() == 'second-key-value'
+
+    def test_missing_api_key_is_not_cached(self):
+        """Test that a missing key is looked up again on the next call"""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                get_api_key()
+            os.environ['VOLCES_API_KEY'] = 'late-key-value'
+            assert get_api_key() == 'late-key-value'
+
+
+class TestImportSideEffects:
+    """Tests that importing the package leaves process state alone"""
+
+    def test_import_does_not_configure_logging_or_load_dotenv(self):
+        """Test that logging and .env loading are deferred until requested"""
+        code = (
+            "import logging, sys\n"
+            "import src.osins_seedance.v3\n"
+            "assert not logging.getLogger().handlers\n"
+            "assert 'dotenv' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
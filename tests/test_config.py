@@ -78,6 +78,9 @@ def test_config_functions_integration():
     
     # Test with custom values
     os.environ['VOLCES_BASE_HOST'] = 'https://integration-test.com'
+    # Both values are cached, so drop them to pick up the new host
+    get_api_base_host.cache_clear()
+    get_v3_api_base_url.cache_clear()
     
     custom_host = get_api_base_host()
     custom_v3_url = get_v3_api_base_url()
@@ -0,0 +1,49 @@
+"""Tests for error classification and reporting in ErrorHandling"""
+
+import pytest
+import requests
+from src.osins_seedance.v3.client.error_handling import ErrorHandling, MAX_ERROR_DETAILS_LENGTH
+
+
+class TestErrorHandling:
+    """Tests for the table-driven ErrorHandling"""
+
+    def test_large_error_body_is_truncated(self, make_response):
+        """Test that huge error pages are capped before they land in the error details"""
+        response = make_response(502, b"x" * (MAX_ERROR_DETAILS_LENGTH + 100))
+
+        result = ErrorHandling().handle_request_exception(requests.exceptions.HTTPError(response=response))
+
+        assert len(result.error["details"]) == MAX_ERROR_DETAILS_LENGTH
+        assert result.error["status_code"] == 502
+
+    @pytest.mark.parametrize("error, expected", [
+        (ValueError("bad"), "validation_error"),
+        (requests.exceptions.JSONDecodeError("bad", "doc", 0), "validation_error"),
+        (requests.exceptions.ConnectTimeout(), "network_error"),
+        (requests.exceptions.ReadTimeout(), "network_error"),
+        (RuntimeError("boom"), "network_error"),
+    ])
+    def test_exceptions_map_to_error_types(self, error, expected):
+        """Test that exception subclasses resolve to the same types as before"""
+        assert ErrorHandling().classify_error(error).value == expected
+
+    @pytest.mark.parametrize("status_code, expected", [
+        (401, "authentication_error"),
+        (429, "rate_limit_error"),
+        (503, "server_error"),
+        (404, "validation_error"),
+    ])
+    def test_http_status_codes_map_to_error_types(self, status_code, expected, make_response):
+        """Test that HTTP errors are classified by their status code"""
+        error = requests.exceptions.HTTPError(response=make_response(status_code))
+
+        assert ErrorHandling().classify_error(error).value == expected
+
+    def test_legacy_error_utils_path_reexports_handlers(self):
+        """Test that the old utils.error_utils import path resolves to the single implementation"""
+        from src.osins_seedance.v3.client import error_handling
+        from src.osins_seedance.v3.utils.error_utils import handle_request_exception, handle_general_exception
+
+        assert handle_request_exception is error_handling.handle_request_exception
+        assert handle_general_exception is error_handling.handle_general_exception
@@ -76,7 +76,7 @@ class TestImprovedFeatures:
         cache_key = cache_mechanism.generate_cache_key(deterministic_request)
         assert cache_key is not None
         assert isinstance(cache_key, str)
-        assert len(cache_key) == 32  # MD5 hash length
+        assert len(cache_key) == 32  # 16-byte BLAKE2b digest
 
         # Non-deterministic request (temperature != 0) should not generate cache key
         non_deterministic_request = SeedanceRequestBody(
@@ -0,0 +1,93 @@
+"""Tests for the request and response models"""
+
+import json
+import pytest
+from src.osins_seedance.v3 import SeedanceRequestBody, SeedanceResponseBody, VideoGenerationRequestBody
+
+
+def _image_item(role):
+    """Build an image content item with the given role"""
+    return {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}, "role": role}
+
+
+class TestSeedanceModels:
+    """Tests for the text generation request and response bodies"""
+
+    def test_malformed_id_is_rejected(self):
+        """Test that the Field pattern still rejects ids outside the allowed characters"""
+        assert SeedanceResponseBody(id="gen-1.2_a").id == "gen-1.2_a"
+        with pytest.raises(ValueError):
+            SeedanceResponseBody(id="gen 1")
+
+    def test_response_body_assignment_skips_validation(self):
+        """Test that responses stay mutable and attribute writes do not re-run the validators"""
+        response = SeedanceResponseBody(id="gen-1")
+
+        response.model = "volces-v3"
+        response.id = "gen 1"
+
+        assert response.model == "volces-v3"
+        assert response.id == "gen 1"
+
+    def test_request_body_payload_is_serialized_once(self):
+        """Test that the cached payload is reused and not carried into updated copies"""
+        request = SeedanceRequestBody(prompt="a cat", model="volces-v3")
+
+        assert request.json_bytes is request.json_bytes
+        assert json.loads(request.json_bytes) == request.model_dump()
+
+        updated = request.model_copy(update={"prompt": "a dog"})
+        assert json.loads(updated.json_bytes)["prompt"] == "a dog"
+
+
+class TestVideoContentValidation:
+    """Tests for the single-pass content combination checks"""
+
+    @pytest.mark.parametrize("content, message", [
+        ([{"type": "draft_task", "draft_task": {"id": "a"}}, {"type": "draft_task", "draft_task": {"id": "b"}}],
+         "Only one draft_task"),
+        ([{"type": "draft_task", "draft_task": {"id": "a"}}, {"type": "text", "text": "hi"}],
+         "draft_task cannot be combined"),
+        ([_image_item("first_frame"), _image_item("reference_image")], "cannot be mixed"),
+        ([_image_item("first_frame"), _image_item("first_frame")], "Only one first_frame"),
+        ([_image_item("first_frame"), _image_item("last_frame"), _image_item("last_frame")],
+         "Only one last_frame"),
+        ([_image_item("last_frame")], "requires a corresponding first_frame"),
+    ])
+    def test_invalid_combinations_are_rejected(self, content, message):
+        """Test that each invalid content combination is still reported"""
+        with pytest.raises(ValueError, match=message):
+            VideoGenerationRequestBody(model="doubao-seedance-1-5-pro", content=content)
+
+    @pytest.mark.parametrize("frames, message", [
+        (25, "between 29 and 289"),
+        (293, "between 29 and 289"),
+        (30, "25 \\+ 4n"),
+    ])
+    def test_invalid_frame_counts_are_rejected(self, frames, message):
+        """Test that frame counts outside the 25 + 4n set keep their specific messages"""
+        with pytest.raises(ValueError, match=message):
+            VideoGenerationRequestBody(model="doubao-seedance-1-0-pro", content=[{"type": "text", "text": "hi"}],
+                                       frames=frames)
+
+    def test_valid_frame_counts_are_accepted(self):
+        """Test the boundaries of the allowed frame counts"""
+        for frames in (29, 121, 289):
+            request = VideoGenerationRequestBody(model="doubao-seedance-1-0-pro",
+                                                 content=[{"type": "text", "text": "hi"}], frames=frames)
+            assert request.frames == frames
+
+    def test_first_and_last_frame_are_accepted(self):
+        """Test that a valid first/last frame pair with text passes validation"""
+        request = VideoGenerationRequestBody(
+            model="doubao-seedance-1-5-pro",
+            content=[{"type": "text", "text": "hi"}, _image_item("first_frame"), _image_item("last_frame")]
+        )
+        assert len(request.content) == 3
+
+    @pytest.mark.parametrize("field", ["watermark", "camera_fixed", "draft", "seed", "service_tier"])
+    def test_defaulted_fields_reject_none(self, field):
+        """Test that fields with a concrete default no longer accept None"""
+        with pytest.raises(ValueError):
+            VideoGenerationRequestBody(model="doubao-seedance-1-5-pro",
+                                       content=[{"type": "text", "text": "hi"}], **{field: None})
@@ -0,0 +1,66 @@
+"""Tests for the batching, metrics and compression helpers in PerformanceOptimization"""
+
+import threading
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+from src.osins_seedance.v3.client.performance_optimization import PerformanceOptimization
+
+
+class TestBatchRequests:
+    """Tests for running request batches concurrently"""
+
+    def test_batch_requests_run_concurrently(self):
+        """Test that requests within a batch overlap instead of running one by one"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def make_request(i):
+            def request():
+                barrier.wait()
+                return i
+            return request
+
+        results = PerformanceOptimization().batch_requests([make_request(i) for i in range(3)], batch_size=3)
+
+        assert results == [0, 1, 2]
+
+    def test_batch_requests_max_workers_overrides_batch_size(self):
+        """Test that max_workers sets the number of requests in flight"""
+        barrier = threading.Barrier(4, timeout=5)
+        requests_list = [lambda i=i: (barrier.wait(), i)[1] for i in range(4)]
+
+        results = PerformanceOptimization().batch_requests(requests_list, batch_size=2, max_workers=4)
+
+        assert results == [0, 1, 2, 3]
+
+
+class TestExecutionTimeMetrics:
+    """Tests for the bounded execution time metrics"""
+
+    def test_samples_are_bounded_but_stats_cover_all_calls(self, capsys):
+        """Test that old samples are dropped while averages and counts include every call"""
+        performance = PerformanceOptimization(max_samples=2)
+        timed = performance.measure_execution_time(lambda: None)
+
+        for _ in range(5):
+            timed()
+
+        name = timed.__name__
+        assert len(performance.metrics[name]) == 2
+        assert performance.get_total_calls(name) == 5
+        assert performance.get_average_execution_time(name) >= 0.0
+        assert capsys.readouterr().out == ""
+
+        performance.cleanup_metrics()
+        assert performance.get_total_calls(name) == 0
+
+
+class TestCompression:
+    """Tests for response compression negotiation"""
+
+    def test_enable_compression_advertises_supported_encodings(self):
+        """Test that compression advertises exactly what urllib3 can decode"""
+        session = requests.Session()
+        PerformanceOptimization().enable_compression(session)
+
+        assert session.headers['Accept-Encoding'] == ACCEPT_ENCODING
+        assert 'gzip' in session.headers['Accept-Encoding']
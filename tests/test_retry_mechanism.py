@@ -0,0 +1,56 @@
+"""Tests for the backoff and retry helpers in retry_mechanism"""
+
+import pytest
+import requests
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.osins_seedance.v3.client.retry_mechanism import exponential_backoff_delay, retry_on_failure
+
+
+class TestRetryMechanism:
+    """Tests for exponential backoff and the retry_on_failure decorator"""
+
+    def test_backoff_delay_uses_full_jitter(self):
+        """Test that backoff delays are drawn from zero up to the exponential cap"""
+        with patch('random.uniform', side_effect=lambda low, high: (low, high)):
+            assert exponential_backoff_delay(0) == (0, 1.0)
+            assert exponential_backoff_delay(3, backoff_factor=0.5) == (0, 4.0)
+            assert exponential_backoff_delay(10) == (0, 60.0)
+
+        assert exponential_backoff_delay(2, jitter=False) == 4.0
+
+    def test_retry_decorator_sleeps_capped_delays_without_jitter(self, monkeypatch):
+        """Test that retry_on_failure passes the cap and jitter setting to each backoff"""
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+
+        @retry_on_failure(max_retries=3, backoff_factor=1.0, max_backoff=3.0, jitter=False)
+        def always_fails():
+            raise requests.exceptions.ConnectionError("down")
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            always_fails()
+
+        assert sleeps == [1.0, 2.0, 3.0]
+
+    def test_retry_status_codes_are_snapshotted(self, monkeypatch):
+        """Test that mutating the caller's status code list after decorating has no effect"""
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+        status_codes = [503]
+        response = SimpleNamespace(status_code=503)
+
+        @retry_on_failure(max_retries=2, status_codes=status_codes, jitter=False)
+        def unavailable():
+            return response
+
+        status_codes.clear()
+
+        assert unavailable() is response
+        assert len(sleeps) == 2
+
+    def test_legacy_retry_utils_path_reexports_decorator(self):
+        """Test that the old utils.retry_utils import path resolves to the single implementation"""
+        from src.osins_seedance.v3.utils.retry_utils import retry_on_failure as legacy_retry_on_failure
+
+        assert legacy_retry_on_failure is retry_on_failure
@@ -0,0 +1,39 @@
+"""Tests for session creation and connection pool reuse"""
+
+from src.osins_seedance.v3.client.connection_pool import ConnectionPoolManager
+from src.osins_seedance.v3.client.session_management import SessionManagement
+
+
+class TestSessionManagement:
+    """Tests for SessionManagement and ConnectionPoolManager"""
+
+    def test_reset_session_keeps_keep_alive_and_compression(self):
+        """Test that resetting session headers keeps the requests connection defaults"""
+        session_management = SessionManagement()
+        session = session_management.create_session({"Authorization": "Bearer old"})
+
+        session_management.reset_session(session, {"Authorization": "Bearer new"})
+
+        assert session.headers["Authorization"] == "Bearer new"
+        assert session.headers["Content-Type"] == "application/json"
+        assert session.headers["Connection"] == "keep-alive"
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_copied_session_shares_the_connection_pool(self):
+        """Test that a copied session reuses the original's pooled adapter"""
+        session_management = SessionManagement()
+        original = session_management.create_session({"Authorization": "Bearer key"})
+
+        copy = session_management.copy_session(original)
+        copy.headers["X-Extra"] = "1"
+
+        assert copy.get_adapter("https://example.com") is original.get_adapter("https://example.com")
+        assert copy.headers["Authorization"] == "Bearer key"
+        assert "X-Extra" not in original.headers
+
+    def test_get_session_reuses_one_pooled_session(self):
+        """Test that get_session returns the same session while create_session builds new ones"""
+        manager = ConnectionPoolManager()
+
+        assert manager.get_session() is manager.get_session()
+        assert manager.create_session() is not manager.get_session()
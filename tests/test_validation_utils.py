@@ -0,0 +1,95 @@
+"""Tests for the cross-field rules left to VideoGenerationValidator"""
+
+import pytest
+from unittest.mock import patch
+from src.osins_seedance.v3 import VideoGenerationRequestBody
+from src.osins_seedance.v3.model.video_generation_request_body import ImageContent, TextContent
+from src.osins_seedance.v3.utils import validation_utils
+from src.osins_seedance.v3.utils.validation_utils import VideoGenerationValidator
+
+
+def _image_item(role):
+    """Build an image content item with the given role"""
+    return {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}, "role": role}
+
+
+class TestVideoGenerationValidator:
+    """Tests for VideoGenerationValidator and validate_video_generation_request"""
+
+    def test_camera_fixed_with_reference_images_is_reported(self):
+        """Test that the camera_fixed/reference image rule is still checked"""
+        request = VideoGenerationRequestBody(
+            model="doubao-seedance-1-0-lite",
+            content=[{"type": "text", "text": "hi"}, _image_item("reference_image")],
+            camera_fixed=True
+        )
+
+        result = VideoGenerationValidator.comprehensive_validation(request)
+
+        assert not result.valid
+        assert result.errors == ('camera_fixed parameter is not supported with reference images',)
+
+    def test_more_than_four_reference_images_is_reported(self):
+        """Test that the reference image limit is still checked"""
+        request = VideoGenerationRequestBody(
+            model="doubao-seedance-1-0-lite",
+            content=[_image_item("reference_image") for _ in range(5)]
+        )
+
+        result = VideoGenerationValidator.validate_content_combinations(request)
+
+        assert result.errors == ('Reference images are limited to 1-4 images',)
+
+    @pytest.mark.parametrize("model, warnings", [
+        ("doubao-seedance-1-5-pro-251215", ()),
+        ("Doubao-Seedance-1-0-Pro", ('Model doubao-seedance-1-0-pro may not support draft mode',)),
+    ])
+    def test_model_compatibility_warnings_follow_model_family(self, model, warnings):
+        """Test that draft mode is only flagged for models outside the 1.5 pro family"""
+        request = VideoGenerationRequestBody(model=model, content=[{"type": "text", "text": "hi"}], draft=True)
+
+        assert VideoGenerationValidator.validate_model_compatibility(request).warnings == warnings
+
+    def test_lite_model_rejects_1080p_reference_images(self):
+        """Test that the lite model limitation is detected from the model id"""
+        request = VideoGenerationRequestBody(model="doubao-seedance-1-0-lite-i2v", resolution="1080p",
+                                             content=[_image_item("reference_image")])
+
+        result = VideoGenerationValidator.validate_model_compatibility(request)
+
+        assert result.errors == (
+            'Model doubao-seedance-1-0-lite-i2v (lite) does not support 1080p resolution with reference images',
+        )
+
+    def test_repeated_validation_is_memoized_on_the_request(self):
+        """Test that validating the same request twice only runs the validators once"""
+        request = VideoGenerationRequestBody(model="doubao-seedance-1-0-lite", content=[{"type": "text", "text": "hi"}])
+
+        with patch.object(VideoGenerationValidator, 'comprehensive_validation',
+                          wraps=VideoGenerationValidator.comprehensive_validation) as mock_validate:
+            assert validation_utils.validate_video_generation_request(request)
+            assert validation_utils.validate_video_generation_request(request)
+
+        assert mock_validate.call_count == 1
+        assert "validation_result" not in request.model_dump()
+
+    def test_updated_copy_is_validated_again(self):
+        """Test that a copy with changed fields does not reuse the original's result"""
+        request = VideoGenerationRequestBody(model="doubao-seedance-1-0-lite",
+                                             content=[{"type": "text", "text": "hi"}, _image_item("reference_image")])
+        assert validation_utils.validate_video_generation_request(request)
+
+        updated = request.model_copy(update={"camera_fixed": True})
+
+        assert not validation_utils.validate_video_generation_request(updated)
+
+    def test_constructed_request_is_validated_without_round_trip(self):
+        """Test that an unvalidated model_construct body returns a failed result instead of raising"""
+        request = VideoGenerationRequestBody.model_construct(
+            model="doubao-seedance-1-0-lite",
+            content=[TextContent(type="text", text="hi"), ImageContent(**_image_item("reference_image"))],
+            camera_fixed=True,
+            frames=30
+        )
+
+        assert not validation_utils.validate_video_generation_request(request)
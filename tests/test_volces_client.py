@@ -0,0 +1,304 @@
+"""Tests for the VolcesClient request paths"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from unittest.mock import patch
+from src.osins_seedance.v3 import VolcesClient, SeedanceRequestBody, SeedanceResponseBody, VideoGenerationRequestBody
+from src.osins_seedance.v3.client import volces_client
+
+
+@pytest.fixture
+def client():
+    """A client with a valid-looking API key"""
+    return VolcesClient(api_key='test-key-longer-than-ten-chars')
+
+
+@pytest.fixture
+def slow_server():
+    """A local HTTP server that delays its responses, reached through the real session adapter"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    # Seconds to stall each successive request before replying; later requests reply at once
+    server.delays = []
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Record each request and stall it for the server's next configured delay"""
+
+    def _reply(self):
+        self.server.requests.append((self.command, self.path))
+        if self.server.delays:
+            threading.Event().wait(self.server.delays.pop(0))
+        body = b'{"object": "list"}'
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            # The client gave up on this request after its read timeout
+            pass
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _video_request(text="A cat running on grass"):
+    """Build a minimal text-to-video request"""
+    return VideoGenerationRequestBody(model="doubao-seedance-1-5-pro", content=[{"type": "text", "text": text}])
+
+
+class TestConnectionWarmUp:
+    """Tests for priming the connection pool at construction"""
+
+    def test_warm_up_sends_head_to_video_tasks_and_base_url_hosts(self):
+        """Test that warm-up opens a connection on the video tasks host as well as the base URL host"""
+        with patch.object(requests.Session, 'head') as mock_head:
+            client = VolcesClient(api_key='test-key-longer-than-ten-chars', base_url='https://api.volces.com/v3')
+            mock_head.assert_not_called()
+
+            client.warm_up().join(timeout=5)
+
+        assert [call.args for call in mock_head.call_args_list] == [
+            ("https://ark.cn-beijing.volces.com",),
+            ("https://api.volces.com",),
+        ]
+
+    def test_warm_up_heads_a_shared_host_once(self):
+        """Test that a base URL on the video tasks host is not warmed twice"""
+        with patch.object(requests.Session, 'head') as mock_head:
+            client = VolcesClient(api_key='test-key-longer-than-ten-chars',
+                                  base_url='https://ark.cn-beijing.volces.com/api/v3')
+            client.warm_up().join(timeout=5)
+
+        assert [call.args for call in mock_head.call_args_list] == [("https://ark.cn-beijing.volces.com",)]
+
+    def test_warm_up_failure_is_swallowed(self):
+        """Test that a failed warm-up does not raise"""
+        with patch.object(requests.Session, 'head', side_effect=requests.exceptions.ConnectionError("down")):
+            client = VolcesClient(api_key='test-key-longer-than-ten-chars')
+            thread = client.warm_up()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+
+class TestResponseCaching:
+    """Tests for how the client uses its response cache"""
+
+    def test_client_cache_limits_are_configurable(self):
+        """Test that the client's cache size and TTL come from its constructor"""
+        client = VolcesClient(api_key='test-key-longer-than-ten-chars', cache_max_size=8, cache_ttl=60)
+
+        assert client.cache_mechanism.max_size == 8
+        assert client.cache_mechanism.ttl == 60
+
+    def test_deterministic_response_keeps_raw_bytes(self, client, make_response, monkeypatch):
+        """Test that a cached response can be read back as the exact bytes received"""
+        body = b'{"id": "gen-1", "object": "text_completion"}'
+        monkeypatch.setattr(client.session, 'post', lambda *args, **kwargs: make_response(200, body))
+
+        request = SeedanceRequestBody(prompt="a cat", temperature=0)
+        client.call_volces_api(request)
+        cache_key = client.cache_mechanism.generate_cache_key(request)
+
+        assert client.cache_mechanism.get_cached_bytes(cache_key) is body
+        assert client.cache_mechanism.get_cached_response(cache_key).id == "gen-1"
+
+    def test_non_deterministic_request_skips_cache(self, client, make_response, monkeypatch):
+        """Test that requests with a non-zero temperature never touch the cache"""
+        monkeypatch.setattr(client.session, 'post', lambda *args, **kwargs: make_response(200, b'{"id": "gen-1"}'))
+
+        with patch.object(client.cache_mechanism, 'generate_cache_key') as mock_key, \
+                patch.object(client.cache_mechanism, 'get_cached_response') as mock_get:
+            response = client.call_volces_api(SeedanceRequestBody(prompt="a cat", temperature=0.7))
+
+        assert response.id == "gen-1"
+        mock_key.assert_not_called()
+        mock_get.assert_not_called()
+        assert not client.cache_mechanism.cache
+
+
+class TestErrorHandlingPath:
+    """Tests for the consolidated exception handling in VolcesClient"""
+
+    def test_http_error_keeps_status_code(self, client, make_response, monkeypatch):
+        """Test that HTTP errors are handled as request errors with their status code"""
+        def mock_get_error(*args, **kwargs):
+            response = make_response(401, b"Unauthorized")
+            raise requests.exceptions.HTTPError("401 Client Error", response=response)
+
+        monkeypatch.setattr(client.session, 'get', mock_get_error)
+
+        response = client.get_volces_models()
+
+        assert response.error["type"] == "authentication_error"
+        assert response.error["status_code"] == 401
+        assert response.error["details"] == "Unauthorized"
+
+
+class TestSingleRetryLayer:
+    """Tests that each kind of failure is retried by exactly one layer"""
+
+    def test_server_error_is_not_retried_by_the_client_method(self, client, make_response, monkeypatch):
+        """Test that a 503 surfacing from the session is reported without re-running the call"""
+        calls = []
+
+        def mock_get(*args, **kwargs):
+            calls.append(kwargs)
+            response = make_response(503, b"Service Unavailable")
+            raise requests.exceptions.HTTPError("503 Server Error", response=response)
+
+        monkeypatch.setattr(client.session, 'get', mock_get)
+        monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+        response = client.get_volces_models()
+
+        assert response.error["status_code"] == 503
+        assert len(calls) == 1
+
+    def test_session_adapter_retries_server_errors(self, client):
+        """Test that the pooled adapter retries server errors and failed connections but never resends"""
+        retries = client.session.get_adapter("https://example.com").max_retries
+
+        assert retries.total == 3
+        assert {502, 503, 504} <= set(retries.status_forcelist)
+        assert retries.read is False
+
+    def test_connect_timeout_is_not_retried_by_the_timeout_schedule(self, monkeypatch):
+        """Test that a connect timeout, already retried by the adapter, ends the schedule"""
+        client = VolcesClient(api_key='test-key-longer-than-ten-chars', timeout_schedule=(1, 2, 3))
+        calls = []
+
+        def mock_get(*args, **kwargs):
+            calls.append(kwargs['timeout'])
+            raise requests.exceptions.ConnectTimeout("connect timed out")
+
+        monkeypatch.setattr(client.session, 'get', mock_get)
+        monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+        response = client.get_volces_models()
+
+        assert response.error["type"] == "network_error"
+        assert calls == [(5, 1)]
+
+
+class TestRequestSerialization:
+    """Tests for the request payload encoding"""
+
+    def test_auth_headers_are_set_once_on_the_session(self, client):
+        """Test that authentication headers live on the session instead of each call"""
+        assert client.session.headers["Authorization"] == "Bearer test-key-longer-than-ten-chars"
+        assert client.session.headers["Content-Type"] == "application/json"
+        assert client.session.headers["Accept"] == "application/json"
+
+    def test_video_request_is_sent_as_utf8_json_bytes(self, client, make_response, monkeypatch):
+        """Test that the request body is posted as pre-serialized JSON bytes"""
+        request = _video_request("一只猫在草地上奔跑")
+        captured = {}
+
+        def mock_post(*args, **kwargs):
+            captured.update(kwargs)
+            return make_response(200, b'{"id": "task-123"}')
+
+        monkeypatch.setattr(client.session, 'post', mock_post)
+
+        response = client.call_video_generation_api(request)
+
+        assert response.id == "task-123"
+        assert "json" not in captured
+        assert "headers" not in captured
+        assert isinstance(captured["data"], bytes)
+        assert json.loads(captured["data"]) == request.model_dump(exclude_unset=True)
+
+
+class TestTimeoutSchedule:
+    """Tests for per-attempt timeouts, sent through the session's real mounted adapter"""
+
+    def test_timed_out_get_is_retried_with_longer_timeouts(self, slow_server, monkeypatch):
+        """Test that each retry of an idempotent request uses the next read timeout"""
+        slow_server.delays[:] = [0.3, 0.3, 0.3]
+        client = VolcesClient(api_key='test-key-longer-than-ten-chars', base_url=slow_server.url,
+                              timeout_schedule=(0.1, 0.1, 2))
+        monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+        response = client.get_volces_models()
+
+        assert response.error is None
+        assert slow_server.requests == [("GET", "/models")] * 3
+
+    def test_timed_out_task_creation_is_not_resent(self, client, slow_server, monkeypatch):
+        """Test that a read timeout on task creation reaches the server exactly once"""
+        slow_server.delays[:] = [0.5]
+        monkeypatch.setattr(volces_client, 'VIDEO_GENERATION_TASKS_URL', f"{slow_server.url}/tasks")
+        monkeypatch.setattr(volces_client, 'VIDEO_GENERATION_READ_TIMEOUT', 0.1)
+        monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+        response = client.call_video_generation_api(_video_request())
+
+        assert response.error["type"] == "network_error"
+        assert slow_server.requests == [("POST", "/tasks")]
+
+    def test_adapter_does_not_resend_after_read_timeout(self, client, slow_server):
+        """Test that the mounted retry policy re-raises read timeouts as ReadTimeout"""
+        slow_server.delays[:] = [0.5]
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client.session.post(f"{slow_server.url}/tasks", data=b"{}", timeout=(1, 0.1))
+
+        assert slow_server.requests == [("POST", "/tasks")]
+
+
+class TestConcurrentRequests:
+    """Tests for submitting several requests at once"""
+
+    def test_video_tasks_are_submitted_concurrently_in_order(self, client, make_response, monkeypatch):
+        """Test that batched tasks overlap and keep the input order"""
+        requests_list = [_video_request(f"prompt {i}") for i in range(4)]
+        barrier = threading.Barrier(4, timeout=5)
+
+        def mock_post(*args, **kwargs):
+            # Every request must be in flight at the same time to pass the barrier
+            barrier.wait()
+            text = json.loads(kwargs['data'])['content'][0]['text']
+            return make_response(200, json.dumps({"id": f"task-{text.split()[-1]}"}).encode())
+
+        monkeypatch.setattr(client.session, 'post', mock_post)
+
+        responses = client.call_video_generation_api_many(requests_list)
+
+        assert [response.id for response in responses] == ["task-0", "task-1", "task-2", "task-3"]
+
+    def test_call_volces_api_many_keeps_order(self, client, monkeypatch):
+        """Test that concurrent generation calls return responses in input order"""
+        bodies = [SeedanceRequestBody(prompt=f"prompt {i}", model="volces-v3") for i in range(3)]
+        monkeypatch.setattr(client, 'call_volces_api', lambda body: SeedanceResponseBody(id=body.prompt.replace(" ", "-")))
+
+        responses = client.call_volces_api_many(bodies)
+
+        assert [response.id for response in responses] == ["prompt-0", "prompt-1", "prompt-2"]
+
+
+class TestPoolSizing:
+    """Tests for configuring the client's connection pool"""
+
+    def test_pool_sizes_reach_the_session_adapter(self):
+        """Test that the pool sizes passed to the client configure the mounted adapter"""
+        client = VolcesClient(api_key='test-key-longer-than-ten-chars', pool_connections=2, pool_maxsize=7)
+        adapter = client.session.get_adapter("https://example.com")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 7
+        assert adapter._pool_block is True
+        assert not hasattr(client, 'connection_pool_manager')